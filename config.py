@@ -2,14 +2,17 @@
 Модуль для работы с настройками и переменными окружения.
 """
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Загружаем переменные окружения из .env файла
 # Сначала загружаем .env, затем .env.local (если есть) для переопределения
 load_dotenv()  # Загружает .env
-load_dotenv('.env.local')  # Переопределяет значения из .env.local, если файл существует
+if os.path.exists('.env.local'):
+    load_dotenv('.env.local')  # Переопределяет значения из .env.local
 
 
+@lru_cache(maxsize=None)
 def get_api_key(api_id: str) -> str:
     """
     Получить API-ключ из переменных окружения.
@@ -20,9 +23,10 @@ def get_api_key(api_id: str) -> str:
     Returns:
         Значение API-ключа или пустая строка, если ключ не найден
     """
-    return os.getenv(api_id, '')
+    return os.environ.get(api_id, '')
 
 
+@lru_cache(maxsize=None)
 def get_setting(key: str, default: str = '') -> str:
     """
     Получить настройку из переменных окружения.
@@ -34,9 +38,10 @@ def get_setting(key: str, default: str = '') -> str:
     Returns:
         Значение настройки или default
     """
-    return os.getenv(key, default)
+    return os.environ.get(key, default)
 
 
+@lru_cache(maxsize=None)
 def get_database_path() -> str:
     """
     Получить путь к файлу базы данных.
@@ -44,4 +49,14 @@ def get_database_path() -> str:
     Returns:
         Путь к файлу БД (по умолчанию 'chatlist.db')
     """
-    return os.getenv('DATABASE_PATH', 'chatlist.db')
+    return os.environ.get('DATABASE_PATH', 'chatlist.db')
+
+
+def clear_env_cache() -> None:
+    """
+    Сбросить кэш значений переменных окружения.
+    Нужно вызывать после изменения os.environ во время работы приложения.
+    """
+    get_api_key.cache_clear()
+    get_setting.cache_clear()
+    get_database_path.cache_clear()
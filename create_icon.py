@@ -1,23 +1,21 @@
-from PIL import Image, ImageDraw
+import io
+from functools import lru_cache
+from pathlib import Path
+from PIL import Image, ImageDraw, ImageOps
 import math
 
+# Размеры иконки до этого значения включительно получаются без скругления углов
+SQUIRCLE_MIN_SIZE = 32
+# Темный темно-синий (низ градиента) — им же заполняются срезанные углы
+BG_END_COLOR = (8, 8, 40)
+
 def create_gradient_background(size, start_color, end_color):
     """Создает градиентный фон от светлого к темному."""
-    img = Image.new("RGB", (size, size))
-    pixels = img.load()
-    
-    for y in range(size):
-        # Вычисляем коэффициент для градиента (0.0 вверху, 1.0 внизу)
-        ratio = y / size
-        # Интерполируем цвет
-        r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-        g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-        b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-        
-        for x in range(size):
-            pixels[x, y] = (r, g, b)
-    
-    return img
+    # Готовый вертикальный градиент PIL (0 вверху, 255 внизу), раскрашенный в нужные цвета
+    ramp = Image.linear_gradient("L")
+    if ramp.size != (size, size):
+        ramp = ramp.resize((size, size))
+    return ImageOps.colorize(ramp, start_color, end_color)
 
 def draw_squircle_mask(size, radius_ratio=0.2):
     """Создает маску для скругленных углов (squircle форма)."""
@@ -36,10 +34,9 @@ def draw_squircle_mask(size, radius_ratio=0.2):
     
     return mask
 
-def draw_geometric_ai(draw, center_x, center_y, size, line_thickness):
-    """Рисует буквы 'AI' в геометрическом стиле."""
-    white_color = (255, 255, 255)
-    
+@lru_cache(maxsize=16)
+def ai_letter_segments(center_x, center_y, size):
+    """Вычисляет отрезки букв 'AI' (пары точек) для заданного размера иконки."""
     # Размер букв (60-70% от размера иконки)
     letter_size = int(size * 0.65)
     letter_spacing = int(size * 0.08)
@@ -63,11 +60,6 @@ def draw_geometric_ai(draw, center_x, center_y, size, line_thickness):
     a_bar_left = (start_x + letter_size // 6, a_bar_y)
     a_bar_right = (start_x + letter_size // 2, a_bar_y)
     
-    # Рисуем букву A
-    draw.line([a_left_bottom, a_left_top], fill=white_color, width=line_thickness)
-    draw.line([a_right_top, a_right_bottom], fill=white_color, width=line_thickness)
-    draw.line([a_bar_left, a_bar_right], fill=white_color, width=line_thickness)
-    
     # === БУКВА "I" ===
     i_start_x = start_x + letter_size + letter_spacing
     i_center_x = i_start_x + letter_size // 6
@@ -75,23 +67,36 @@ def draw_geometric_ai(draw, center_x, center_y, size, line_thickness):
     # Вертикальная линия I
     i_top = (i_center_x, start_y)
     i_bottom = (i_center_x, start_y + letter_size)
-    draw.line([i_top, i_bottom], fill=white_color, width=line_thickness)
     
     # Верхняя горизонтальная линия I
     i_top_line_left = (i_start_x, start_y)
     i_top_line_right = (i_start_x + letter_size // 3, start_y)
-    draw.line([i_top_line_left, i_top_line_right], fill=white_color, width=line_thickness)
     
     # Нижняя горизонтальная линия I
     i_bottom_line_left = (i_start_x, start_y + letter_size)
     i_bottom_line_right = (i_start_x + letter_size // 3, start_y + letter_size)
-    draw.line([i_bottom_line_left, i_bottom_line_right], fill=white_color, width=line_thickness)
+    
+    return (
+        (a_left_bottom, a_left_top),
+        (a_right_top, a_right_bottom),
+        (a_bar_left, a_bar_right),
+        (i_top, i_bottom),
+        (i_top_line_left, i_top_line_right),
+        (i_bottom_line_left, i_bottom_line_right),
+    )
+
+def draw_geometric_ai(draw, center_x, center_y, size, line_thickness):
+    """Рисует буквы 'AI' в геометрическом стиле."""
+    white_color = (255, 255, 255)
+    
+    for segment in ai_letter_segments(center_x, center_y, size):
+        draw.line(segment, fill=white_color, width=line_thickness)
 
 def draw_icon(size):
-    """Рисует иконку: темно-синий градиентный фон, темно-красный круг, белые буквы AI."""
+    """Рисует иконку без скругления углов: темно-синий градиентный фон, темно-красный круг, белые буквы AI."""
     # Цвета
     bg_start = (25, 25, 112)  # Светлый темно-синий (вверху)
-    bg_end = (8, 8, 40)       # Темный темно-синий (внизу)
+    bg_end = BG_END_COLOR     # Темный темно-синий (внизу)
     circle_color = (100, 0, 20)  # Темно-красный цвет гнилой вишни
     white_color = (255, 255, 255)
     
@@ -121,42 +126,47 @@ def draw_icon(size):
     # Рисуем буквы "AI" внутри круга
     draw_geometric_ai(draw, center_x, center_y, size, line_thickness)
     
-    # Применяем скругление углов (squircle форма)
-    mask = draw_squircle_mask(size, radius_ratio=0.15)
-    img.putalpha(mask)
-    
-    # Конвертируем обратно в RGB для ICO формата
-    if img.mode == "RGBA":
-        # Создаем белый фон для прозрачных областей
-        rgb_img = Image.new("RGB", img.size, bg_end)
-        rgb_img.paste(img, mask=img.split()[3] if img.mode == "RGBA" else None)
-        return rgb_img
-    
     return img
 
+def round_icon_corners(img):
+    """Скругляет углы иконки (squircle форма)."""
+    mask = draw_squircle_mask(img.size[0], radius_ratio=0.15)
+    
+    # Накладываем изображение на фон по маске сразу в RGB для ICO формата
+    rgb_img = Image.new("RGB", img.size, BG_END_COLOR)
+    rgb_img.paste(img, mask=mask)
+    return rgb_img
+
 # Размеры иконки для Windows ICO
 sizes = [256, 128, 64, 48, 32, 16]
-icons = []
 
 print("Создание иконки приложения...")
 print("   Дизайн: темно-синий градиентный фон, темно-красный круг, белые буквы AI")
 print("   Размеры:", ", ".join([f"{s}x{s}" for s in sizes]))
 
-for size in sizes:
-    icon = draw_icon(size)
-    # Убеждаемся, что изображение в RGB режиме
-    if icon.mode != "RGB":
-        icon = icon.convert("RGB")
-    icons.append(icon)
+# Рисуем иконку один раз в максимальном размере, остальные получаем уменьшением
+flat_icon = draw_icon(sizes[0])
+# Убеждаемся, что изображение в RGB режиме
+if flat_icon.mode != "RGB":
+    flat_icon = flat_icon.convert("RGB")
+base_icon = round_icon_corners(flat_icon)
+# На маленьких размерах радиус скругления — 1-2 пикселя, поэтому они уменьшаются
+# из варианта без скругления
+icons = [base_icon] + [
+    (base_icon if size > SQUIRCLE_MIN_SIZE else flat_icon).resize((size, size), Image.LANCZOS)
+    for size in sizes[1:]
+]
 
-# Сохранение в формате ICO
+# Сохранение в формате ICO: кодируем в память и записываем файл одним вызовом
 try:
+    buffer = io.BytesIO()
     icons[0].save(
-        "app.ico",
+        buffer,
         format="ICO",
         sizes=[(s, s) for s in sizes],
         append_images=icons[1:]
     )
+    Path("app.ico").write_bytes(buffer.getvalue())
     print("OK: Иконка 'app.ico' успешно создана!")
     print(f"   Создано {len(sizes)} размеров: {', '.join([f'{s}x{s}' for s in sizes])}")
 except Exception as e:
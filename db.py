@@ -2,85 +2,316 @@
 Модуль для работы с базой данных SQLite.
 Инкапсулирует все операции с БД.
 """
+import atexit
 import sqlite3
-import os
-from datetime import datetime
+import threading
 from typing import List, Dict, Optional, Tuple
 from config import get_database_path
 
 
 DB_PATH = get_database_path()
 
+# Размер кэша подготовленных выражений sqlite3 (по умолчанию всего 128)
+CACHED_STATEMENTS = 256
+
+# После пакетной вставки такого числа строк пересчитывается статистика (ANALYZE)
+ANALYZE_BULK_THRESHOLD = 100
+
+# Время записи вычисляет сам SQLite (локальное время)
+SQL_NOW = "strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')"
+
+# Все повторяющиеся запросы вынесены в константы: одна и та же строка SQL
+# всегда попадает в кэш подготовленных выражений соединения
+SQL_INSERT_PROMPT = f"INSERT INTO prompts (date, prompt, tags) VALUES ({SQL_NOW}, ?, ?)"
+SQL_SELECT_ALL_PROMPTS = "SELECT * FROM prompts ORDER BY date DESC"
+SQL_SELECT_PROMPT_BY_ID = "SELECT * FROM prompts WHERE id = ?"
+SQL_UPDATE_PROMPT = "UPDATE prompts SET prompt = ?, tags = ? WHERE id = ?"
+SQL_DELETE_PROMPT = "DELETE FROM prompts WHERE id = ?"
+# LIKE в SQLite без ICU не различает регистр только у ASCII; unicode_lower
+# (регистрируется в get_connection) приводит кириллицу к тому же виду, что и FTS-индекс
+SQL_SEARCH_PROMPTS = (
+    "SELECT * FROM prompts WHERE unicode_lower(prompt) LIKE ? OR unicode_lower(tags) LIKE ? "
+    "ORDER BY date DESC"
+)
+SQL_SEARCH_PROMPTS_FTS = (
+    "SELECT * FROM prompts WHERE id IN "
+    "(SELECT rowid FROM prompts_fts WHERE prompts_fts MATCH ?) ORDER BY date DESC"
+)
+
+SQL_INSERT_MODEL = "INSERT INTO models (name, api_url, api_id, is_active) VALUES (?, ?, ?, ?)"
+SQL_SELECT_ALL_MODELS = "SELECT * FROM models ORDER BY name"
+SQL_SELECT_ACTIVE_MODELS = "SELECT * FROM models WHERE is_active = 1 ORDER BY name"
+SQL_SELECT_MODEL_BY_ID = "SELECT * FROM models WHERE id = ?"
+SQL_UPDATE_MODEL = "UPDATE models SET name = ?, api_url = ?, api_id = ?, is_active = ? WHERE id = ?"
+SQL_DELETE_MODEL = "DELETE FROM models WHERE id = ?"
+SQL_TOGGLE_MODEL_ACTIVE = "UPDATE models SET is_active = ? WHERE id = ?"
+SQL_SEARCH_MODELS = "SELECT * FROM models WHERE name LIKE ? OR api_url LIKE ? ORDER BY name"
+
+SQL_INSERT_RESULT = (
+    "INSERT INTO results (prompt_id, model_name, response_text, created_at) "
+    f"VALUES (?, ?, ?, {SQL_NOW})"
+)
+# id — второй ключ сортировки: у результатов, сохранённых в одну секунду,
+# порядок должен быть одинаковым во всех запросах, иначе страницы пересекаются
+SQL_SELECT_ALL_RESULTS = "SELECT * FROM results ORDER BY created_at DESC, id DESC"
+SQL_SELECT_RESULTS_PAGE = "SELECT * FROM results ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
+SQL_COUNT_RESULTS = "SELECT COUNT(*) AS count FROM results"
+SQL_SELECT_RESULTS_BY_PROMPT = "SELECT * FROM results WHERE prompt_id = ? ORDER BY created_at DESC"
+SQL_DELETE_RESULT = "DELETE FROM results WHERE id = ?"
+SQL_SEARCH_RESULTS = (
+    "SELECT * FROM results WHERE unicode_lower(response_text) LIKE ? OR unicode_lower(model_name) LIKE ? "
+    "ORDER BY created_at DESC"
+)
+SQL_SEARCH_RESULTS_FTS = (
+    "SELECT * FROM results WHERE id IN "
+    "(SELECT rowid FROM results_fts WHERE results_fts MATCH ?) ORDER BY created_at DESC"
+)
+
+# Допустимые поля сортировки и готовые запросы для каждой пары (поле, порядок)
+SORT_ORDERS = frozenset(('ASC', 'DESC'))
+PROMPT_SORT_FIELDS = frozenset(('date', 'prompt', 'tags'))
+RESULT_SORT_FIELDS = frozenset(('created_at', 'model_name', 'prompt_id'))
+SQL_SORT_PROMPTS = {
+    (field, order): f"SELECT * FROM prompts ORDER BY {field} {order}"
+    for field in PROMPT_SORT_FIELDS for order in SORT_ORDERS
+}
+SQL_SORT_RESULTS = {
+    (field, order): f"SELECT * FROM results ORDER BY {field} {order}"
+    for field in RESULT_SORT_FIELDS for order in SORT_ORDERS
+}
+
+SQL_UPSERT_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+SQL_SELECT_ALL_SETTINGS = "SELECT key, value FROM settings"
+
+# Схема БД: все таблицы и индексы создаются одним скриптом
+SCHEMA_SQL = """
+-- Таблица промптов
+CREATE TABLE IF NOT EXISTS prompts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')),
+    prompt TEXT NOT NULL,
+    tags TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_prompts_date ON prompts(date);
+CREATE INDEX IF NOT EXISTS idx_prompts_tags ON prompts(tags);
+
+-- Таблица моделей
+CREATE TABLE IF NOT EXISTS models (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    api_url TEXT NOT NULL,
+    api_id TEXT NOT NULL,
+    is_active INTEGER NOT NULL DEFAULT 1 CHECK(is_active IN (0, 1))
+);
+CREATE INDEX IF NOT EXISTS idx_models_active ON models(is_active);
+CREATE INDEX IF NOT EXISTS idx_models_name ON models(name);
+
+-- Таблица результатов
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    prompt_id INTEGER NOT NULL,
+    model_name TEXT NOT NULL,
+    response_text TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')),
+    FOREIGN KEY (prompt_id) REFERENCES prompts(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_results_prompt_id ON results(prompt_id);
+CREATE INDEX IF NOT EXISTS idx_results_model_name ON results(model_name);
+CREATE INDEX IF NOT EXISTS idx_results_created_at ON results(created_at);
+
+-- Таблица настроек
+CREATE TABLE IF NOT EXISTS settings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_settings_key ON settings(key);
+"""
+
+# Полнотекстовый индекс (FTS5, токенизатор trigram) для поиска по подстроке.
+# Триграммы позволяют искать так же, как LIKE '%...%', но по индексу;
+# запросы короче трёх символов выполняются обычным LIKE.
+FTS_MIN_QUERY_LENGTH = 3
+
+# Виртуальные таблицы индекса
+FTS_TABLES = {
+    'prompts_fts': """
+        CREATE VIRTUAL TABLE prompts_fts USING fts5(
+            prompt, tags, content='prompts', content_rowid='id', tokenize='trigram'
+        );
+    """,
+    'results_fts': """
+        CREATE VIRTUAL TABLE results_fts USING fts5(
+            response_text, model_name, content='results', content_rowid='id', tokenize='trigram'
+        );
+    """,
+}
+
+# Триггеры синхронизации индекса с исходной таблицей и его перестроение.
+# Без FTS5 такие триггеры ломают любую запись в таблицу, поэтому они создаются
+# только при доступном FTS5 и удаляются, если БД открыта сборкой SQLite без него
+FTS_TRIGGERS = {
+    'prompts_fts': """
+        CREATE TRIGGER IF NOT EXISTS prompts_fts_ai AFTER INSERT ON prompts BEGIN
+            INSERT INTO prompts_fts(rowid, prompt, tags) VALUES (new.id, new.prompt, new.tags);
+        END;
+        CREATE TRIGGER IF NOT EXISTS prompts_fts_ad AFTER DELETE ON prompts BEGIN
+            INSERT INTO prompts_fts(prompts_fts, rowid, prompt, tags)
+            VALUES ('delete', old.id, old.prompt, old.tags);
+        END;
+        CREATE TRIGGER IF NOT EXISTS prompts_fts_au AFTER UPDATE ON prompts BEGIN
+            INSERT INTO prompts_fts(prompts_fts, rowid, prompt, tags)
+            VALUES ('delete', old.id, old.prompt, old.tags);
+            INSERT INTO prompts_fts(rowid, prompt, tags) VALUES (new.id, new.prompt, new.tags);
+        END;
+        INSERT INTO prompts_fts(prompts_fts) VALUES ('rebuild');
+    """,
+    'results_fts': """
+        CREATE TRIGGER IF NOT EXISTS results_fts_ai AFTER INSERT ON results BEGIN
+            INSERT INTO results_fts(rowid, response_text, model_name)
+            VALUES (new.id, new.response_text, new.model_name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS results_fts_ad AFTER DELETE ON results BEGIN
+            INSERT INTO results_fts(results_fts, rowid, response_text, model_name)
+            VALUES ('delete', old.id, old.response_text, old.model_name);
+        END;
+        CREATE TRIGGER IF NOT EXISTS results_fts_au AFTER UPDATE ON results BEGIN
+            INSERT INTO results_fts(results_fts, rowid, response_text, model_name)
+            VALUES ('delete', old.id, old.response_text, old.model_name);
+            INSERT INTO results_fts(rowid, response_text, model_name)
+            VALUES (new.id, new.response_text, new.model_name);
+        END;
+        INSERT INTO results_fts(results_fts) VALUES ('rebuild');
+    """,
+}
+FTS_TRIGGER_SUFFIXES = ('_ai', '_ad', '_au')
+
+# Становится True, если SQLite собран с поддержкой FTS5 и индекс создан
+fts_enabled = False
+
+# Сколько миллисекунд ждать освобождения блокировки БД другим соединением
+BUSY_TIMEOUT_MS = 5000
+
+# Настройки читаются из БД один раз и дальше отдаются из памяти (ключ -> значение)
+_settings_cache: Optional[Dict[str, str]] = None
+
+# Соединения кэшируются по одному на поток и переиспользуются между вызовами
+_local = threading.local()
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+
+
+def _unicode_lower(value):
+    """Привести строку к нижнему регистру с учётом Unicode (для SQL-функции unicode_lower)."""
+    return value.lower() if isinstance(value, str) else value
+
+
+def _dict_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict:
+    """Преобразовать строку результата запроса в словарь (колонка -> значение)."""
+    return dict(zip([column[0] for column in cursor.description], row))
+
 
 def get_connection():
-    """Создать соединение с базой данных."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row  # Для доступа к колонкам по имени
+    """
+    Получить соединение с базой данных.
+    Соединение создаётся один раз для каждого потока и затем переиспользуется,
+    поэтому каждая запись выполняется в блоке `with conn:` — при ошибке транзакция
+    откатывается и не остаётся открытой (вместе с блокировкой на запись).
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(
+            DB_PATH,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS
+        )
+        conn.row_factory = _dict_factory  # Строки сразу возвращаются словарями
+        conn.create_function("unicode_lower", 1, _unicode_lower, deterministic=True)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        _local.conn = conn
+        with _connections_lock:
+            _connections.append(conn)
     return conn
 
 
+@atexit.register
+def close_connections():
+    """Закрыть все открытые соединения с базой данных."""
+    with _connections_lock:
+        for conn in _connections:
+            try:
+                # Обновляет статистику планировщика для часто используемых индексов
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            conn.close()
+        _connections.clear()
+    _local.__dict__.pop('conn', None)
+
+
 def init_database():
     """
     Инициализация базы данных: создание файла БД и всех таблиц.
-    Проверяет существование БД и создаёт её при первом запуске.
-    """
-    if not os.path.exists(DB_PATH):
-        # Создаём файл БД
-        conn = get_connection()
-        cursor = conn.cursor()
-        
-        # Таблица промптов
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS prompts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                prompt TEXT NOT NULL,
-                tags TEXT
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_prompts_date ON prompts(date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_prompts_tags ON prompts(tags)")
-        
-        # Таблица моделей
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS models (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                api_url TEXT NOT NULL,
-                api_id TEXT NOT NULL,
-                is_active INTEGER NOT NULL DEFAULT 1 CHECK(is_active IN (0, 1))
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_models_active ON models(is_active)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_models_name ON models(name)")
-        
-        # Таблица результатов
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                prompt_id INTEGER NOT NULL,
-                model_name TEXT NOT NULL,
-                response_text TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                FOREIGN KEY (prompt_id) REFERENCES prompts(id) ON DELETE CASCADE
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_prompt_id ON results(prompt_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_model_name ON results(model_name)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_results_created_at ON results(created_at)")
-        
-        # Таблица настроек
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                key TEXT NOT NULL UNIQUE,
-                value TEXT
-            )
-        """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_settings_key ON settings(key)")
-        
-        conn.commit()
-        conn.close()
+    Все выражения схемы идемпотентны (IF NOT EXISTS), поэтому функцию
+    можно безопасно вызывать при каждом запуске.
+    """
+    conn = get_connection()
+    conn.executescript(SCHEMA_SQL)
+    init_fulltext_search()
+
+
+def _fts_available(conn: sqlite3.Connection) -> bool:
+    """Проверить, что SQLite собран с FTS5 и токенизатором trigram."""
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp.fts_probe")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def init_fulltext_search():
+    """
+    Создать полнотекстовые индексы для поиска промптов и результатов.
+    Для уже существующей БД индекс заполняется текущими данными.
+    Если SQLite собран без FTS5, поиск продолжит работать через LIKE.
+    """
+    global fts_enabled
+    conn = get_connection()
+    existing = {
+        row['name'] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger')"
+        )
+    }
+    if not _fts_available(conn):
+        # Триггеры, оставшиеся от сборки с FTS5, обращались бы к недоступному модулю
+        with conn:
+            for table in FTS_TRIGGERS:
+                for suffix in FTS_TRIGGER_SUFFIXES:
+                    conn.execute(f"DROP TRIGGER IF EXISTS {table}{suffix}")
+        fts_enabled = False
+        return
+    try:
+        for table, script in FTS_TABLES.items():
+            if table not in existing:
+                conn.executescript(script)
+            # Триггеры могли быть удалены сборкой без FTS5 — тогда индекс устарел
+            # и перестраивается вместе с их созданием
+            if table not in existing or any(f"{table}{suffix}" not in existing for suffix in FTS_TRIGGER_SUFFIXES):
+                conn.executescript(FTS_TRIGGERS[table])
+    except sqlite3.OperationalError:
+        fts_enabled = False
+        return
+    fts_enabled = True
+
+
+def _fts_phrase(query: str) -> str:
+    """Экранировать запрос как фразу FTS5 (поиск по подстроке)."""
+    return '"' + query.replace('"', '""') + '"'
 
 
 # ==================== CRUD операции для таблицы prompts ====================
@@ -97,25 +328,37 @@ def create_prompt(prompt: str, tags: Optional[str] = None) -> int:
         ID созданного промпта
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    date = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    cursor.execute(
-        "INSERT INTO prompts (date, prompt, tags) VALUES (?, ?, ?)",
-        (date, prompt, tags)
-    )
+    with conn:
+        cursor = conn.execute(SQL_INSERT_PROMPT, (prompt, tags))
     prompt_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
     return prompt_id
 
 
+def create_prompts_bulk(items: List[Tuple[str, Optional[str]]]) -> int:
+    """
+    Создать несколько промптов одной транзакцией.
+    
+    Args:
+        items: Список кортежей (текст промпта, теги)
+    
+    Returns:
+        Количество созданных промптов
+    """
+    if not items:
+        return 0
+    conn = get_connection()
+    with conn:
+        conn.executemany(SQL_INSERT_PROMPT, items)
+    if len(items) >= ANALYZE_BULK_THRESHOLD:
+        conn.execute("ANALYZE")
+    return len(items)
+
+
 def get_all_prompts() -> List[Dict]:
     """Получить все промпты."""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM prompts ORDER BY date DESC")
-    prompts = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SELECT_ALL_PROMPTS)
+    prompts = cursor.fetchall()
     return prompts
 
 
@@ -130,11 +373,8 @@ def get_prompt_by_id(prompt_id: int) -> Optional[Dict]:
         Словарь с данными промпта или None
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM prompts WHERE id = ?", (prompt_id,))
-    row = cursor.fetchone()
-    conn.close()
-    return dict(row) if row else None
+    cursor = conn.execute(SQL_SELECT_PROMPT_BY_ID, (prompt_id,))
+    return cursor.fetchone()
 
 
 def update_prompt(prompt_id: int, prompt: str, tags: Optional[str] = None) -> bool:
@@ -150,14 +390,9 @@ def update_prompt(prompt_id: int, prompt: str, tags: Optional[str] = None) -> bo
         True если обновление успешно, False иначе
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE prompts SET prompt = ?, tags = ? WHERE id = ?",
-        (prompt, tags, prompt_id)
-    )
+    with conn:
+        cursor = conn.execute(SQL_UPDATE_PROMPT, (prompt, tags, prompt_id))
     success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
     return success
 
 
@@ -172,11 +407,9 @@ def delete_prompt(prompt_id: int) -> bool:
         True если удаление успешно, False иначе
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM prompts WHERE id = ?", (prompt_id,))
+    with conn:
+        cursor = conn.execute(SQL_DELETE_PROMPT, (prompt_id,))
     success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
     return success
 
 
@@ -191,14 +424,12 @@ def search_prompts(query: str) -> List[Dict]:
         Список найденных промптов
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    search_term = f"%{query}%"
-    cursor.execute(
-        "SELECT * FROM prompts WHERE prompt LIKE ? OR tags LIKE ? ORDER BY date DESC",
-        (search_term, search_term)
-    )
-    prompts = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    if fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+        cursor = conn.execute(SQL_SEARCH_PROMPTS_FTS, (_fts_phrase(query),))
+    else:
+        search_term = f"%{query.lower()}%"
+        cursor = conn.execute(SQL_SEARCH_PROMPTS, (search_term, search_term))
+    prompts = cursor.fetchall()
     return prompts
 
 
@@ -213,17 +444,14 @@ def sort_prompts(field: str = 'date', order: str = 'DESC') -> List[Dict]:
     Returns:
         Отсортированный список промптов
     """
-    valid_fields = ['date', 'prompt', 'tags']
-    if field not in valid_fields:
+    if field not in PROMPT_SORT_FIELDS:
         field = 'date'
-    if order not in ['ASC', 'DESC']:
+    if order not in SORT_ORDERS:
         order = 'DESC'
     
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM prompts ORDER BY {field} {order}")
-    prompts = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SORT_PROMPTS[(field, order)])
+    prompts = cursor.fetchall()
     return prompts
 
 
@@ -243,34 +471,40 @@ def create_model(name: str, api_url: str, api_id: str, is_active: int = 1) -> in
         ID созданной модели
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO models (name, api_url, api_id, is_active) VALUES (?, ?, ?, ?)",
-        (name, api_url, api_id, is_active)
-    )
+    with conn:
+        cursor = conn.execute(SQL_INSERT_MODEL, (name, api_url, api_id, is_active))
     model_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
     return model_id
 
 
 def get_all_models() -> List[Dict]:
     """Получить все модели."""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM models ORDER BY name")
-    models = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SELECT_ALL_MODELS)
+    models = cursor.fetchall()
     return models
 
 
+def get_model_by_id(model_id: int) -> Optional[Dict]:
+    """
+    Получить модель по ID.
+    
+    Args:
+        model_id: ID модели
+    
+    Returns:
+        Словарь с данными модели или None
+    """
+    conn = get_connection()
+    cursor = conn.execute(SQL_SELECT_MODEL_BY_ID, (model_id,))
+    return cursor.fetchone()
+
+
 def get_active_models() -> List[Dict]:
     """Получить только активные модели."""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM models WHERE is_active = 1 ORDER BY name")
-    models = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SELECT_ACTIVE_MODELS)
+    models = cursor.fetchall()
     return models
 
 
@@ -289,14 +523,9 @@ def update_model(model_id: int, name: str, api_url: str, api_id: str, is_active:
         True если обновление успешно, False иначе
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "UPDATE models SET name = ?, api_url = ?, api_id = ?, is_active = ? WHERE id = ?",
-        (name, api_url, api_id, is_active, model_id)
-    )
+    with conn:
+        cursor = conn.execute(SQL_UPDATE_MODEL, (name, api_url, api_id, is_active, model_id))
     success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
     return success
 
 
@@ -311,11 +540,9 @@ def delete_model(model_id: int) -> bool:
         True если удаление успешно, False иначе
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM models WHERE id = ?", (model_id,))
+    with conn:
+        cursor = conn.execute(SQL_DELETE_MODEL, (model_id,))
     success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
     return success
 
 
@@ -331,11 +558,9 @@ def toggle_model_active(model_id: int, is_active: int) -> bool:
         True если обновление успешно, False иначе
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("UPDATE models SET is_active = ? WHERE id = ?", (is_active, model_id))
+    with conn:
+        cursor = conn.execute(SQL_TOGGLE_MODEL_ACTIVE, (is_active, model_id))
     success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
     return success
 
 
@@ -350,14 +575,9 @@ def search_models(query: str) -> List[Dict]:
         Список найденных моделей
     """
     conn = get_connection()
-    cursor = conn.cursor()
     search_term = f"%{query}%"
-    cursor.execute(
-        "SELECT * FROM models WHERE name LIKE ? OR api_url LIKE ? ORDER BY name",
-        (search_term, search_term)
-    )
-    models = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SEARCH_MODELS, (search_term, search_term))
+    models = cursor.fetchall()
     return models
 
 
@@ -376,28 +596,69 @@ def save_result(prompt_id: int, model_name: str, response_text: str) -> int:
         ID сохранённого результата
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    cursor.execute(
-        "INSERT INTO results (prompt_id, model_name, response_text, created_at) VALUES (?, ?, ?, ?)",
-        (prompt_id, model_name, response_text, created_at)
-    )
+    with conn:
+        cursor = conn.execute(SQL_INSERT_RESULT, (prompt_id, model_name, response_text))
     result_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
     return result_id
 
 
+def save_results_bulk(items: List[Tuple[int, str, str]]) -> int:
+    """
+    Сохранить несколько результатов одной транзакцией.
+    
+    Args:
+        items: Список кортежей (ID промпта, название модели, текст ответа)
+    
+    Returns:
+        Количество сохранённых результатов
+    """
+    if not items:
+        return 0
+    conn = get_connection()
+    # BEGIN внутри уже открытой транзакции невозможен; незавершённую чужую
+    # транзакцию на этом соединении откатываем
+    if conn.in_transaction:
+        conn.rollback()
+    # Блокировка на запись берётся сразу, а не при первой вставке:
+    # так транзакция не упрётся в SQLITE_BUSY посередине
+    conn.execute("BEGIN IMMEDIATE")
+    with conn:
+        conn.executemany(SQL_INSERT_RESULT, items)
+    if len(items) >= ANALYZE_BULK_THRESHOLD:
+        conn.execute("ANALYZE")
+    return len(items)
+
+
 def get_all_results() -> List[Dict]:
     """Получить все результаты."""
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM results ORDER BY created_at DESC")
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SELECT_ALL_RESULTS)
+    results = cursor.fetchall()
     return results
 
 
+def get_results_page(offset: int, limit: int) -> List[Dict]:
+    """
+    Получить страницу результатов (в том же порядке, что и get_all_results).
+    
+    Args:
+        offset: Сколько результатов пропустить
+        limit: Максимальное количество результатов на странице
+    
+    Returns:
+        Список результатов
+    """
+    conn = get_connection()
+    cursor = conn.execute(SQL_SELECT_RESULTS_PAGE, (limit, offset))
+    return cursor.fetchall()
+
+
+def count_results() -> int:
+    """Получить количество сохранённых результатов."""
+    conn = get_connection()
+    return conn.execute(SQL_COUNT_RESULTS).fetchone()['count']
+
+
 def get_results_by_prompt_id(prompt_id: int) -> List[Dict]:
     """
     Получить результаты по ID промпта.
@@ -409,13 +670,8 @@ def get_results_by_prompt_id(prompt_id: int) -> List[Dict]:
         Список результатов для данного промпта
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "SELECT * FROM results WHERE prompt_id = ? ORDER BY created_at DESC",
-        (prompt_id,)
-    )
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SELECT_RESULTS_BY_PROMPT, (prompt_id,))
+    results = cursor.fetchall()
     return results
 
 
@@ -430,11 +686,9 @@ def delete_result(result_id: int) -> bool:
         True если удаление успешно, False иначе
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM results WHERE id = ?", (result_id,))
+    with conn:
+        cursor = conn.execute(SQL_DELETE_RESULT, (result_id,))
     success = cursor.rowcount > 0
-    conn.commit()
-    conn.close()
     return success
 
 
@@ -449,14 +703,12 @@ def search_results(query: str) -> List[Dict]:
         Список найденных результатов
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    search_term = f"%{query}%"
-    cursor.execute(
-        "SELECT * FROM results WHERE response_text LIKE ? OR model_name LIKE ? ORDER BY created_at DESC",
-        (search_term, search_term)
-    )
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    if fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+        cursor = conn.execute(SQL_SEARCH_RESULTS_FTS, (_fts_phrase(query),))
+    else:
+        search_term = f"%{query.lower()}%"
+        cursor = conn.execute(SQL_SEARCH_RESULTS, (search_term, search_term))
+    results = cursor.fetchall()
     return results
 
 
@@ -471,17 +723,14 @@ def sort_results(field: str = 'created_at', order: str = 'DESC') -> List[Dict]:
     Returns:
         Отсортированный список результатов
     """
-    valid_fields = ['created_at', 'model_name', 'prompt_id']
-    if field not in valid_fields:
+    if field not in RESULT_SORT_FIELDS:
         field = 'created_at'
-    if order not in ['ASC', 'DESC']:
+    if order not in SORT_ORDERS:
         order = 'DESC'
     
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM results ORDER BY {field} {order}")
-    results = [dict(row) for row in cursor.fetchall()]
-    conn.close()
+    cursor = conn.execute(SQL_SORT_RESULTS[(field, order)])
+    results = cursor.fetchall()
     return results
 
 
@@ -497,12 +746,10 @@ def get_setting(key: str) -> Optional[str]:
     Returns:
         Значение настройки или None
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-    row = cursor.fetchone()
-    conn.close()
-    return row['value'] if row else None
+    global _settings_cache
+    if _settings_cache is None:
+        _settings_cache = get_all_settings()
+    return _settings_cache.get(key)
 
 
 def set_setting(key: str, value: str) -> bool:
@@ -517,13 +764,10 @@ def set_setting(key: str, value: str) -> bool:
         True если сохранение успешно
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-        (key, value)
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(SQL_UPSERT_SETTING, (key, value))
+    if _settings_cache is not None:
+        _settings_cache[key] = value
     return True
 
 
@@ -535,8 +779,6 @@ def get_all_settings() -> Dict[str, str]:
         Словарь всех настроек (ключ -> значение)
     """
     conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT key, value FROM settings")
+    cursor = conn.execute(SQL_SELECT_ALL_SETTINGS)
     settings = {row['key']: row['value'] for row in cursor.fetchall()}
-    conn.close()
     return settings
@@ -6,6 +6,10 @@ from datetime import datetime
 from typing import List, Dict
 
 
+# Размер буфера записи файла экспорта (1 МБ): мелкие записи копятся в памяти
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
 def export_to_markdown(results: List[Dict], prompt_text: str = "", output_file: str = "results.md") -> bool:
     """
     Экспортировать результаты в Markdown формат.
@@ -19,7 +23,8 @@ def export_to_markdown(results: List[Dict], prompt_text: str = "", output_file:
         True если экспорт успешен, False иначе
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
+        # Документ пишется в файл по частям, без сборки всей строки в памяти
+        with open(output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             # Заголовок
             f.write("# Результаты сравнения моделей\n\n")
             f.write(f"**Дата экспорта:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
@@ -38,10 +43,10 @@ def export_to_markdown(results: List[Dict], prompt_text: str = "", output_file:
                 f.write(f"## {idx}. {model_name}\n\n")
                 
                 if not success:
-                    f.write(f"**Статус:** ❌ Ошибка\n\n")
+                    f.write("**Статус:** ❌ Ошибка\n\n")
                     f.write(f"**Сообщение:** {response_text}\n\n")
                 else:
-                    f.write(f"**Статус:** ✅ Успешно\n\n")
+                    f.write("**Статус:** ✅ Успешно\n\n")
                     f.write(f"**Ответ:**\n\n{response_text}\n\n")
                 
                 f.write("---\n\n")
@@ -65,22 +70,25 @@ def export_to_json(results: List[Dict], prompt_text: str = "", output_file: str
         True если экспорт успешен, False иначе
     """
     try:
-        export_data = {
-            'export_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'prompt': prompt_text,
-            'results': []
-        }
-        
-        for result in results:
-            export_data['results'].append({
-                'model_name': result.get('model_name', 'Неизвестная модель'),
-                'response_text': result.get('response_text', ''),
-                'success': result.get('success', False),
-                'selected': result.get('selected', False)
-            })
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, ensure_ascii=False, indent=2)
+        # Пишем JSON по частям: каждый результат сериализуется и сразу уходит в файл,
+        # без построения общего словаря со всеми ответами
+        with open(output_file, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write('{\n')
+            f.write(f'  "export_date": {json.dumps(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))},\n')
+            f.write(f'  "prompt": {json.dumps(prompt_text, ensure_ascii=False)},\n')
+            f.write('  "results": [')
+            
+            for idx, result in enumerate(results):
+                item = {
+                    'model_name': result.get('model_name', 'Неизвестная модель'),
+                    'response_text': result.get('response_text', ''),
+                    'success': result.get('success', False),
+                    'selected': result.get('selected', False)
+                }
+                f.write(',\n    ' if idx else '\n    ')
+                f.write(json.dumps(item, ensure_ascii=False, indent=2).replace('\n', '\n    '))
+            
+            f.write('\n  ]\n}' if results else ']\n}')
         
         return True
     except Exception as e:
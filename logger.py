@@ -3,6 +3,7 @@
 """
 import logging
 import os
+import threading
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 
@@ -21,8 +22,9 @@ def setup_logger(log_level: str = "INFO", log_file: str = "chatlist.log") -> log
     logger = logging.getLogger('ChatList')
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
-    # Удаляем существующие обработчики
-    logger.handlers.clear()
+    # Обработчики уже настроены — повторно их не пересоздаём
+    if logger.handlers:
+        return logger
     
     # Формат логов
     formatter = logging.Formatter(
@@ -61,11 +63,15 @@ def log_request(logger: logging.Logger, model_name: str, prompt: str, success: b
         response: Текст ответа (если успешно)
         error: Текст ошибки (если неуспешно)
     """
+    # Ленивое форматирование через %s: строки обрезаются и собираются,
+    # только если сообщение с таким уровнем действительно будет записано
     if success:
-        logger.info(f"Запрос к модели '{model_name}' успешен. Промпт: {prompt[:100]}...")
-        logger.debug(f"Ответ от '{model_name}': {response[:500]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Запрос к модели '%s' успешен. Промпт: %.100s...", model_name, prompt)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Ответ от '%s': %.500s...", model_name, response)
     else:
-        logger.error(f"Ошибка запроса к модели '{model_name}': {error}. Промпт: {prompt[:100]}...")
+        logger.error("Ошибка запроса к модели '%s': %s. Промпт: %.100s...", model_name, error, prompt)
 
 
 def log_action(logger: logging.Logger, action: str, details: str = ""):
@@ -77,11 +83,14 @@ def log_action(logger: logging.Logger, action: str, details: str = ""):
         action: Описание действия
         details: Дополнительные детали
     """
-    logger.info(f"Действие: {action}. {details}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Действие: %s. %s", action, details)
 
 
 # Глобальный логгер (инициализируется при первом импорте)
 _logger = None
+_log_level = None
+_logger_lock = threading.Lock()
 
 
 def get_logger() -> logging.Logger:
@@ -91,11 +100,14 @@ def get_logger() -> logging.Logger:
     Returns:
         Объект логгера
     """
-    global _logger
+    global _logger, _log_level
     if _logger is None:
-        # Загружаем уровень логирования из настроек
-        import db
-        db.init_database()
-        log_level = db.get_setting('log_level') or 'INFO'
-        _logger = setup_logger(log_level)
+        with _logger_lock:
+            if _logger is None:
+                # Загружаем уровень логирования из настроек (один раз)
+                if _log_level is None:
+                    import db
+                    db.init_database()
+                    _log_level = db.get_setting('log_level') or 'INFO'
+                _logger = setup_logger(_log_level)
     return _logger
@@ -2,30 +2,33 @@
 Главный файл приложения ChatList.
 Графический интерфейс на PyQt5.
 """
+import re
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache, partial
+from typing import List, Dict, Optional, Tuple
 
 # Отключаем системные звуки Windows для этого приложения
 os.environ['QT_AUDIO_DEVICE'] = 'none'
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QTextEdit, QComboBox, QTableWidget, QTableWidgetItem,
+    QLabel, QPushButton, QTextEdit, QComboBox, QTableView,
     QCheckBox, QLineEdit, QMessageBox, QDialog, QDialogButtonBox,
     QHeaderView, QMenuBar, QMenu, QAction, QActionGroup, QStatusBar, QProgressBar, QFileDialog,
     QTextBrowser, QSizePolicy, QSpinBox, QGroupBox, QRadioButton, QButtonGroup
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QCoreApplication, QTimer, QRectF
-from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QLinearGradient, QBrush, QIcon
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QCoreApplication, QTimer, QRect, QRectF, QAbstractTableModel, QModelIndex
+)
+from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QLinearGradient, QBrush, QIcon, QPixmap
 
 import db
-import markdown
 from models import Model, load_models_from_db, get_active_models_list
-from network import send_to_all_models
-from export import export_to_markdown, export_to_json
+# network (тянет requests), prompt_improver и export импортируются при первом
+# использовании: это заметно сокращает время запуска приложения
 from logger import get_logger, log_request, log_action
-from prompt_improver import improve_prompt_with_alternatives
 from version import __version__
 
 
@@ -35,28 +38,166 @@ THEME_LIGHT = 'light'
 THEME_DARK = 'dark'
 THEME_SYSTEM = 'system'
 
+# Текущая (последняя применённая) тема приложения; None — тема ещё не применялась.
+# Обновляется в apply_theme, диалоги читают её вместо запроса к БД
+_CURRENT_THEME: Optional[str] = None
+
+# Задержка поиска в диалогах после последнего нажатия клавиши (мс)
+SEARCH_DEBOUNCE_MS = 150
+
+# Максимальное число одновременных запросов к моделям
+MAX_PARALLEL_REQUESTS = 8
+
+
+# Библиотека dwmapi для тёмной строки заголовка (загружается один раз, только в Windows)
+_dwmapi = None
+if sys.platform == 'win32':
+    try:
+        import ctypes
+        from ctypes import wintypes
+        _dwmapi = ctypes.windll.dwmapi
+        # Сигнатура задаётся один раз: ctypes не подбирает типы аргументов при каждом вызове
+        _dwmapi.DwmSetWindowAttribute.argtypes = [
+            wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD
+        ]
+        # Значения атрибута (выкл./вкл.) создаются один раз и передаются по ссылке
+        _DWM_FLAG_VALUES = (ctypes.c_int(0), ctypes.c_int(1))
+    except (ImportError, OSError, AttributeError):
+        _dwmapi = None
+
+DWM_WA_USE_IMMERSIVE_DARK_MODE = 20  # Windows 10 1809+
+
 
 def _set_windows_dark_title_bar(app: QApplication, dark: bool) -> None:
     """
     Включить или отключить тёмную строку заголовка для окон в Windows 10/11.
     """
-    if sys.platform != 'win32':
+    if _dwmapi is None:
         return
     try:
-        import ctypes
-        from ctypes import wintypes
-        HWND = wintypes.HWND
-        DWM_WA_USE_IMMERSIVE_DARK_MODE = 20  # Windows 10 1809+
-        dwm = ctypes.windll.dwmapi
+        value = _DWM_FLAG_VALUES[1 if dark else 0]
+        value_ref = ctypes.byref(value)
+        value_size = ctypes.sizeof(value)
+        set_attribute = _dwmapi.DwmSetWindowAttribute
         for w in app.topLevelWidgets():
             if w.isWindow() and w.winId():
-                hwnd = int(w.winId())
-                value = ctypes.c_int(1 if dark else 0)
-                dwm.DwmSetWindowAttribute(HWND(hwnd), DWM_WA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(value), ctypes.sizeof(value))
+                set_attribute(int(w.winId()), DWM_WA_USE_IMMERSIVE_DARK_MODE, value_ref, value_size)
     except Exception:
         pass
 
 
+# Стили приложения для тёмной темы (подсказки и пункты меню)
+DARK_APP_STYLESHEET = """
+    QToolTip { color: #ffffff; background-color: #2a2a2a; border: 1px solid #3d3d3d; }
+    QMenu::item:selected { background-color: #2a82da; }
+"""
+
+# Стили диалогов в тёмной теме: общая часть (фон окна и кнопки) и дополнения
+# для отдельных диалогов; строки собираются один раз при загрузке модуля
+DARK_DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #353535;
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #353535;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 6px 20px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #2a82da;
+        border-color: #2a82da;
+    }
+    QPushButton:pressed {
+        background-color: #1e5fa0;
+    }
+"""
+
+_DARK_LABEL_STYLESHEET = """
+    QLabel {
+        color: #ffffff;
+    }
+"""
+
+DARK_RESULTS_DIALOG_STYLESHEET = DARK_DIALOG_STYLESHEET + _DARK_LABEL_STYLESHEET + """
+    QLineEdit {
+        background-color: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 4px;
+        border-radius: 3px;
+    }
+    QTableView {
+        background-color: #2a2a2a;
+        color: #ffffff;
+        gridline-color: #555555;
+        selection-background-color: #2a82da;
+    }
+    QHeaderView::section {
+        background-color: #353535;
+        color: #ffffff;
+        padding: 4px;
+        border: 1px solid #555555;
+    }
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #888888;
+        border-color: #444444;
+    }
+"""
+
+DARK_SETTINGS_DIALOG_STYLESHEET = DARK_DIALOG_STYLESHEET + _DARK_LABEL_STYLESHEET + """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #555555;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+    }
+    QRadioButton {
+        color: #ffffff;
+    }
+    QSpinBox {
+        background-color: #2a2a2a;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 4px;
+        border-radius: 3px;
+    }
+"""
+
+DARK_ABOUT_DIALOG_STYLESHEET = DARK_DIALOG_STYLESHEET + _DARK_LABEL_STYLESHEET
+
+# Палитра тёмной темы строится один раз, при первом применении (нужен QApplication)
+_DARK_PALETTE: Optional[QPalette] = None
+
+
+def _build_dark_palette() -> QPalette:
+    """Построить палитру тёмной темы."""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(53, 53, 53))
+    palette.setColor(QPalette.WindowText, Qt.white)
+    palette.setColor(QPalette.Base, QColor(35, 35, 35))
+    palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+    palette.setColor(QPalette.ToolTipBase, Qt.white)
+    palette.setColor(QPalette.ToolTipText, Qt.white)
+    palette.setColor(QPalette.Text, Qt.white)
+    palette.setColor(QPalette.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ButtonText, Qt.white)
+    palette.setColor(QPalette.BrightText, Qt.red)
+    palette.setColor(QPalette.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.HighlightedText, Qt.black)
+    return palette
+
+
 def apply_theme(app: QApplication, theme: str) -> None:
     """
     Применить тему к приложению.
@@ -65,31 +206,23 @@ def apply_theme(app: QApplication, theme: str) -> None:
         app: Экземпляр QApplication
         theme: Одна из констант THEME_LIGHT, THEME_DARK, THEME_SYSTEM
     """
+    global _CURRENT_THEME, _DARK_PALETTE
     if theme not in (THEME_LIGHT, THEME_DARK, THEME_SYSTEM):
         theme = THEME_SYSTEM
+    # Тема уже применена — палитру и строки заголовка окон не трогаем
+    if theme == _CURRENT_THEME:
+        return
+    _CURRENT_THEME = theme
     
-    app.setStyle('Fusion')
+    # Стиль пересоздаётся и переприменяется ко всем виджетам, поэтому ставим его один раз
+    if app.style().metaObject().className() != 'QFusionStyle':
+        app.setStyle('Fusion')
     
     if theme == THEME_DARK:
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        palette.setColor(QPalette.WindowText, Qt.white)
-        palette.setColor(QPalette.Base, QColor(35, 35, 35))
-        palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.ToolTipBase, Qt.white)
-        palette.setColor(QPalette.ToolTipText, Qt.white)
-        palette.setColor(QPalette.Text, Qt.white)
-        palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        palette.setColor(QPalette.BrightText, Qt.red)
-        palette.setColor(QPalette.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.HighlightedText, Qt.black)
-        app.setPalette(palette)
-        app.setStyleSheet("""
-            QToolTip { color: #ffffff; background-color: #2a2a2a; border: 1px solid #3d3d3d; }
-            QMenu::item:selected { background-color: #2a82da; }
-        """)
+        if _DARK_PALETTE is None:
+            _DARK_PALETTE = _build_dark_palette()
+        app.setPalette(_DARK_PALETTE)
+        app.setStyleSheet(DARK_APP_STYLESHEET)
         _set_windows_dark_title_bar(app, dark=True)
     elif theme == THEME_LIGHT:
         app.setPalette(app.style().standardPalette())
@@ -102,6 +235,13 @@ def apply_theme(app: QApplication, theme: str) -> None:
         _set_windows_dark_title_bar(app, dark=False)
 
 
+def get_current_theme() -> str:
+    """Текущая тема приложения (до первого apply_theme — сохранённая в настройках)."""
+    if _CURRENT_THEME is not None:
+        return _CURRENT_THEME
+    return db.get_setting(THEME_SETTING_KEY) or THEME_SYSTEM
+
+
 # Инструкция для автоматического добавления к промптам
 MARKDOWN_FORMATTING_INSTRUCTION = (
     "\n\n"
@@ -111,6 +251,150 @@ MARKDOWN_FORMATTING_INSTRUCTION = (
 )
 
 
+# Скомпилированные шаблоны для strip_markdown
+_RE_BLANKS = re.compile(r'\n{3,}')
+# Символы, с которых может начинаться строчная разметка
+_RE_INLINE_MARK = re.compile(r'[*_`\[!]')
+# Признаки разметки, при которых текст нужно разбирать, а не только подчищать пробелы.
+# Блочная разметка ищется лишь в начале строки: поиск идёт по строкам, склеенным
+# через '\n', с '\n' и перед первой строкой (так регулярное выражение начинается с литерала)
+_RE_MARKDOWN_BLOCK_HINT = re.compile(r'\n[^\S\n]*(?:[-*+#>`]|\d+\.)')
+# Строчная разметка: парные * или _ в одной строке, код в `...`, ссылка «](»
+_RE_MARKDOWN_INLINE_HINT = re.compile(r'\*[^*\n]*\*|_[^_\n]*_|`[^`\n]+`|\]\(')
+# Первые символы строки, с которых может начинаться блочная разметка
+_LINE_PREFIX_CHARS = frozenset('#-*+>0123456789 \t')
+
+# Тексты длиннее этого числа символов разбираются без кэширования
+STRIP_MARKDOWN_CACHE_MAX_LEN = 20_000
+
+
+def _strip_inline(line: str) -> str:
+    """Убрать строчную разметку (жирный, курсив, код, ссылки) за один проход по строке."""
+    m = _RE_INLINE_MARK.search(line)
+    if m is None:
+        return line
+    out = []
+    i = 0
+    n = len(line)
+    while i < n:
+        if i:
+            m = _RE_INLINE_MARK.search(line, i)
+        if m is None:
+            out.append(line[i:])
+            break
+        j = m.start()
+        out.append(line[i:j])
+        ch = line[j]
+        
+        if ch == '`':
+            # Код (`код`)
+            close = line.find('`', j + 1)
+            if close > j + 1:
+                out.append(line[j + 1:close])
+                i = close + 1
+                continue
+        elif ch == '[' or (ch == '!' and line.startswith('[]', j + 1)):
+            # Ссылки [текст](url) -> текст, изображения без подписи ![](url) удаляются
+            start = j + 1 if ch == '[' else j + 2
+            close = line.find(']', start)
+            if close != -1 and (ch == '!' or close > start) and line.startswith('(', close + 1):
+                end = line.find(')', close + 2)
+                if end > close + 2:
+                    if ch == '[':
+                        out.append(_strip_inline(line[start:close]))
+                    i = end + 1
+                    continue
+        elif ch in '*_':
+            double = line.startswith(ch * 2, j)
+            if double:
+                # Жирный текст (**текст** или __текст__)
+                close = line.find(ch * 2, j + 3)
+                if close != -1:
+                    out.append(_strip_inline(line[j + 2:close]))
+                    i = close + 2
+                    continue
+            elif j == 0 or line[j - 1] != ch:
+                # Курсив (*текст* или _текст_): одиночный маркер, не соседствующий с таким же
+                close = j + 1
+                while True:
+                    close = line.find(ch, close + 1)
+                    if close == -1:
+                        break
+                    if line[close - 1] != ch and not line.startswith(ch, close + 1):
+                        break
+                if close != -1:
+                    out.append(_strip_inline(line[j + 1:close]))
+                    i = close + 1
+                    continue
+        
+        # Маркер без пары — оставляем как есть
+        out.append(ch)
+        i = j + 1
+    return ''.join(out)
+
+
+def _strip_line_prefix(line: str) -> str:
+    """Убрать блочную разметку в начале строки: заголовок, маркер списка, цитату."""
+    if line[:1] not in _LINE_PREFIX_CHARS:
+        return line
+    
+    # Заголовки (# ## ###)
+    if line.startswith('#'):
+        level = len(line) - len(line.lstrip('#'))
+        rest = line[level:]
+        if level <= 6 and rest[:1].isspace() and rest.strip():
+            line = rest.lstrip()
+    
+    # Маркированные (- * +) и нумерованные (1. 2.) списки
+    body = line.lstrip()
+    if body[:1] in ('-', '*', '+') and body[1:2].isspace():
+        line = body[1:].lstrip()
+    else:
+        digits = len(body) - len(body.lstrip('0123456789'))
+        if digits and body[digits:digits + 1] == '.' and body[digits + 1:digits + 2].isspace():
+            line = body[digits + 1:].lstrip()
+    
+    # Цитаты (> текст)
+    if line.startswith('>') and line[1:2].isspace():
+        line = line[1:].lstrip()
+    return line
+
+
+def _strip_markdown_scan(text: str) -> str:
+    """Удалить Markdown-разметку за один проход по строкам текста."""
+    lines = text.splitlines()
+    cleaned = []
+    i = 0
+    count = len(lines)
+    while i < count:
+        line = lines[i]
+        
+        # Блоки кода (```код```) удаляются целиком, если у них есть закрывающая ограда
+        if line.lstrip().startswith('```'):
+            close = next((k for k in range(i + 1, count) if lines[k].lstrip().startswith('```')), -1)
+            if close != -1:
+                cleaned.append('')
+                i = close + 1
+                continue
+        i += 1
+        
+        # Горизонтальные линии (--- или ***)
+        if len(line) >= 3 and not line.strip('-*'):
+            cleaned.append('')
+            continue
+        
+        cleaned.append(_strip_inline(_strip_line_prefix(line)).strip())
+    
+    # Убираем лишние пустые строки (более 2 подряд)
+    return _RE_BLANKS.sub('\n\n', '\n'.join(cleaned)).strip()
+
+
+@lru_cache(maxsize=256)
+def _strip_markdown_cached(text: str) -> str:
+    """Результат разбора кэшируется: одинаковые ответы не разбираются повторно."""
+    return _strip_markdown_scan(text)
+
+
 def strip_markdown(text: str) -> str:
     """
     Удалить Markdown-разметку из текста, оставив только обычный текст.
@@ -118,76 +402,255 @@ def strip_markdown(text: str) -> str:
     """
     if not text:
         return text
+    # Ответы без признаков разметки обходятся без разбора:
+    # достаточно подчистить пробелы по краям строк и лишние пустые строки
+    if not _RE_MARKDOWN_INLINE_HINT.search(text):
+        lines = text.splitlines()
+        if not _RE_MARKDOWN_BLOCK_HINT.search('\n' + '\n'.join(lines)):
+            return _RE_BLANKS.sub('\n\n', '\n'.join([line.strip() for line in lines])).strip()
+    # Очень длинные тексты в кэш не кладём, чтобы он не удерживал мегабайты
+    if len(text) > STRIP_MARKDOWN_CACHE_MAX_LEN:
+        return _strip_markdown_scan(text)
+    return _strip_markdown_cached(text)
+
+
+def clear_strip_markdown_cache() -> None:
+    """Сбросить кэш результатов strip_markdown."""
+    _strip_markdown_cached.cache_clear()
+
+
+class RequestThread(QThread):
+    """Поток для выполнения запросов к моделям."""
     
-    import re
+    finished = pyqtSignal(list)  # Сигнал с результатами
+    progress = pyqtSignal(int)  # Сигнал с числом уже полученных ответов
     
-    # Удаляем заголовки (# ## ###)
-    text = re.sub(r'^#{1,6}\s+(.+)$', r'\1', text, flags=re.MULTILINE)
+    def __init__(self, models: List[Model], prompt: str):
+        super().__init__()
+        self.models = models
+        self.prompt = prompt
     
-    # Удаляем маркированные списки (- * +)
-    text = re.sub(r'^[\s]*[-*+]\s+', '', text, flags=re.MULTILINE)
+    def run(self):
+        """Выполнить запросы к моделям параллельно (порядок результатов — как у моделей)."""
+        from network import send_request_to_model
+        results: List[Optional[Dict]] = [None] * len(self.models)
+        workers = max(1, min(MAX_PARALLEL_REQUESTS, len(self.models)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(send_request_to_model, model, self.prompt): idx
+                for idx, model in enumerate(self.models)
+            }
+            # Ответы обрабатываются по мере готовности, прогресс виден сразу
+            for done, future in enumerate(as_completed(futures), 1):
+                idx = futures[future]
+                success, response = future.result()
+                results[idx] = {
+                    'model': self.models[idx],
+                    'success': success,
+                    'response': response,
+                    # Текст для таблицы готовим здесь, чтобы не нагружать поток интерфейса
+                    'plain_text': strip_markdown(response) if success else f"Ошибка: {response}"
+                }
+                self.progress.emit(done)
+        self.finished.emit(results)
+
+
+class ExportThread(QThread):
+    """Поток для записи экспорта в файл, чтобы не блокировать интерфейс."""
     
-    # Удаляем нумерованные списки (1. 2. и т.д.)
-    text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
+    finished = pyqtSignal(bool, str)  # Сигнал: успех, путь к файлу
     
-    # Удаляем жирный текст (**текст** или __текст__)
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-    text = re.sub(r'__(.+?)__', r'\1', text)
+    def __init__(self, exporter, results: List[Dict], prompt: str, file_path: str):
+        super().__init__()
+        self.exporter = exporter
+        self.results = results
+        self.prompt = prompt
+        self.file_path = file_path
     
-    # Удаляем курсив (*текст* или _текст_)
-    text = re.sub(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)', r'\1', text)
-    text = re.sub(r'(?<!_)_(?!_)(.+?)(?<!_)_(?!_)', r'\1', text)
+    def run(self):
+        """Выполнить экспорт."""
+        success = self.exporter(self.results, self.prompt, self.file_path)
+        self.finished.emit(success, self.file_path)
+
+
+class RowsTableModel(QAbstractTableModel):
+    """
+    Табличная модель поверх списка словарей из БД.
+    Qt запрашивает данные только для видимых ячеек, поэтому загрузка не зависит от числа строк.
+    """
     
-    # Удаляем код (`код`)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    HEADERS: Tuple[str, ...] = ()
+    # Ключи словаря строки для каждой колонки (в порядке HEADERS)
+    KEYS: Tuple[str, ...] = ()
     
-    # Удаляем ссылки [текст](url) -> текст
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[Dict] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.UserRole:
+            # ID записи доступен из любой ячейки строки
+            return self.rows[index.row()]['id']
+        if role != Qt.DisplayRole:
+            return None
+        key = self.KEYS[index.column()]
+        return self.display_value(key, self.rows[index.row()][key])
+    
+    def display_value(self, key: str, value) -> str:
+        """Текст ячейки для значения value из поля key."""
+        return '' if value is None else str(value)
+    
+    def set_rows(self, rows: List[Dict]) -> None:
+        """Заменить данные модели."""
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+    
+    def append_rows(self, rows: List[Dict]) -> None:
+        """Добавить строки в конец одной вставкой."""
+        if not rows:
+            return
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+    
+    def row_data(self, index: QModelIndex) -> Optional[Dict]:
+        """Получить словарь строки по индексу ячейки."""
+        if not index.isValid():
+            return None
+        return self.rows[index.row()]
+
+
+class PromptsTableModel(RowsTableModel):
+    """Модель таблицы промптов."""
     
-    # Удаляем изображения ![alt](url)
-    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', r'\1', text)
+    HEADERS = ("ID", "Дата", "Промпт", "Теги")
+    KEYS = ('id', 'date', 'prompt', 'tags')
+
+
+class ModelsTableModel(RowsTableModel):
+    """Модель таблицы нейросетей."""
     
-    # Удаляем горизонтальные линии (--- или ***)
-    text = re.sub(r'^[-*]{3,}$', '', text, flags=re.MULTILINE)
+    HEADERS = ("ID", "Название", "URL API", "API ID", "Активна")
+    KEYS = ('id', 'name', 'api_url', 'api_id', 'is_active')
     
-    # Удаляем блоки кода (```код```)
-    text = re.sub(r'```[\s\S]*?```', '', text)
+    def display_value(self, key: str, value) -> str:
+        if key == 'is_active':
+            return "Да" if value else "Нет"
+        return super().display_value(key, value)
+
+
+class ResultsTableModel(RowsTableModel):
+    """
+    Модель таблицы сохранённых результатов.
+    Строки либо задаются списком (set_rows), либо подгружаются из БД страницами
+    по мере прокрутки (set_paged_source).
+    """
     
-    # Удаляем цитаты (> текст)
-    text = re.sub(r'^>\s+', '', text, flags=re.MULTILINE)
+    HEADERS = ("ID", "Промпт ID", "Модель", "Ответ", "Дата")
+    KEYS = ('id', 'prompt_id', 'model_name', 'response_text', 'created_at')
     
-    # Убираем лишние пустые строки (более 2 подряд)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._fetch_page = None  # функция (offset, limit) -> строки; None — все строки уже в модели
+        self._total = 0
+    
+    def set_rows(self, rows: List[Dict]) -> None:
+        self._fetch_page = None
+        super().set_rows(rows)
+    
+    def set_paged_source(self, fetch_page, total: int) -> None:
+        """Показывать строки, подгружая их страницами по RESULTS_PAGE_SIZE (первую — сразу)."""
+        self.beginResetModel()
+        self.rows = fetch_page(0, RESULTS_PAGE_SIZE)
+        self._fetch_page = fetch_page
+        self._total = total
+        self.endResetModel()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_page is not None and len(self.rows) < self._total
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        rows = self._fetch_page(len(self.rows), RESULTS_PAGE_SIZE)
+        if not rows:
+            # Часть результатов удалили после подсчёта
+            self._total = len(self.rows)
+            return
+        self.append_rows(rows)
     
-    # Убираем пробелы в начале и конце строк
-    lines = [line.strip() for line in text.split('\n')]
-    text = '\n'.join(lines)
+    def data(self, index, role=Qt.DisplayRole):
+        # Полный текст ответа показываем в подсказке
+        if role == Qt.ToolTipRole and index.isValid() and index.column() == 3:
+            return self.rows[index.row()]['response_text'] or ""
+        return super().data(index, role)
     
-    return text.strip()
+    def display_value(self, key: str, value) -> str:
+        if key == 'response_text':
+            # Обрезаем до 100 символов для компактного отображения
+            value = value or ""
+            return value[:100] + "..." if len(value) > 100 else value
+        return super().display_value(key, value)
 
 
-class RequestThread(QThread):
-    """Поток для выполнения запросов к моделям."""
-    
-    finished = pyqtSignal(list)  # Сигнал с результатами
-    
-    def __init__(self, models: List[Model], prompt: str):
-        super().__init__()
-        self.models = models
-        self.prompt = prompt
+class TempResultsTableModel(RowsTableModel):
+    """
+    Модель временной таблицы результатов главного окна.
+    Строки — словари из MainWindow.temp_results; флажок «Выбрано» хранится в поле 'selected'.
+    """
     
-    def run(self):
-        """Выполнить запросы к моделям."""
-        results = []
-        for model in self.models:
-            from network import send_request_to_model
-            success, response = send_request_to_model(model, self.prompt)
-            results.append({
-                'model': model,
-                'success': success,
-                'response': response
-            })
-        self.finished.emit(results)
+    HEADERS = ("Модель", "Ответ", "Выбрано")
+    KEYS = ('model_name', 'plain_text', 'selected')
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        column = index.column()
+        if column == 2:
+            # Колонка флажка: только состояние, без текста
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row['selected'] else Qt.Unchecked
+            return None
+        if role == Qt.DisplayRole:
+            return row[self.KEYS[column]]
+        if role == Qt.ForegroundRole and column == 0 and not row['success']:
+            return QColor(Qt.red)
+        if role == Qt.TextAlignmentRole and column == 1:
+            return Qt.AlignTop | Qt.AlignLeft
+        return None
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 2:
+            # Ответы с ошибкой выбрать нельзя
+            if not self.rows[index.row()]['success']:
+                return Qt.ItemIsSelectable
+            return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or not index.isValid() or index.column() != 2:
+            return False
+        self.rows[index.row()]['selected'] = value == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
 
 
 class ModelDialog(QDialog):
@@ -248,9 +711,31 @@ class ModelDialog(QDialog):
         }
 
 
+# Фоновый поток для запросов к БД из диалогов; поток один и живёт до выхода,
+# поэтому SQLite-соединение для него открывается тоже один раз
+_db_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _submit_db_query(fn, *args):
+    """Выполнить функцию модуля db в фоновом потоке и вернуть Future."""
+    global _db_executor
+    if _db_executor is None:
+        _db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db')
+    return _db_executor.submit(fn, *args)
+
+
+def _fetch_prompts(query: str) -> List[Dict]:
+    """Получить промпты из БД: все или по строке поиска."""
+    if query:
+        return db.search_prompts(query)
+    return db.get_all_prompts()
+
+
 class PromptsDialog(QDialog):
     """Диалог для просмотра и выбора промптов."""
     
+    prompts_loaded = pyqtSignal(int, list)  # Сигнал: номер запроса, строки
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("История промптов")
@@ -263,16 +748,24 @@ class PromptsDialog(QDialog):
         search_layout = QHBoxLayout()
         search_layout.addWidget(QLabel("Поиск:"))
         self.search_edit = QLineEdit()
-        self.search_edit.textChanged.connect(self.search_prompts)
+        # Поиск запускается после паузы в наборе, а не на каждое нажатие клавиши
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.load_prompts)
+        self.search_edit.textChanged.connect(lambda: self.search_timer.start())
         search_layout.addWidget(self.search_edit)
+        # Поиск выполняется в фоновом потоке; устаревшие ответы отбрасываются по номеру
+        self._load_generation = 0
+        self.prompts_loaded.connect(self.on_prompts_loaded)
         layout.addLayout(search_layout)
         
         # Таблица промптов
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["ID", "Дата", "Промпт", "Теги"])
+        self.model = PromptsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.doubleClicked.connect(self.accept_selection)
         layout.addWidget(self.table)
         
@@ -283,41 +776,42 @@ class PromptsDialog(QDialog):
         layout.addWidget(buttons)
         
         self.setLayout(layout)
-        self.load_prompts()
+        # Первая загрузка — до показа окна, синхронно
+        self.model.set_rows(_fetch_prompts(""))
+        # Ширину колонок подбираем один раз, дальше пользователь меняет её сам
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
     
     def load_prompts(self):
-        """Загрузить промпты в таблицу."""
-        prompts = db.get_all_prompts()
-        self.table.setRowCount(len(prompts))
-        
-        for row, prompt in enumerate(prompts):
-            self.table.setItem(row, 0, QTableWidgetItem(str(prompt['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(prompt['date']))
-            self.table.setItem(row, 2, QTableWidgetItem(prompt['prompt']))
-            self.table.setItem(row, 3, QTableWidgetItem(prompt['tags'] or ''))
-        
-        self.table.resizeColumnsToContents()
+        """Загрузить промпты в таблицу (с учётом строки поиска) в фоновом потоке."""
+        self._load_generation += 1
+        generation = self._load_generation
+        future = _submit_db_query(_fetch_prompts, self.search_edit.text())
+        future.add_done_callback(lambda f: self._emit_prompts_loaded(generation, f))
+    
+    def _emit_prompts_loaded(self, generation: int, future):
+        """Передать результат запроса в поток интерфейса."""
+        try:
+            prompts = future.result()
+        except Exception as e:
+            get_logger().error("Ошибка загрузки промптов: %s", e)
+            return
+        try:
+            self.prompts_loaded.emit(generation, prompts)
+        except RuntimeError:
+            # Диалог уже закрыт и удалён
+            pass
     
-    def search_prompts(self):
-        """Поиск промптов."""
-        query = self.search_edit.text()
-        if query:
-            prompts = db.search_prompts(query)
-        else:
-            prompts = db.get_all_prompts()
-        
-        self.table.setRowCount(len(prompts))
-        for row, prompt in enumerate(prompts):
-            self.table.setItem(row, 0, QTableWidgetItem(str(prompt['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(prompt['date']))
-            self.table.setItem(row, 2, QTableWidgetItem(prompt['prompt']))
-            self.table.setItem(row, 3, QTableWidgetItem(prompt['tags'] or ''))
+    def on_prompts_loaded(self, generation: int, prompts: List[Dict]):
+        """Показать загруженные промпты, если это ответ на последний запрос."""
+        if generation == self._load_generation:
+            self.model.set_rows(prompts)
     
     def accept_selection(self):
         """Принять выбранный промпт."""
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            self.selected_prompt_id = int(self.table.item(current_row, 0).text())
+        prompt_id = self.table.currentIndex().data(Qt.UserRole)
+        if prompt_id is not None:
+            self.selected_prompt_id = prompt_id
             self.accept()
 
 
@@ -385,10 +879,8 @@ class PromptImproverDialog(QDialog):
             alt_layout.addWidget(alt_edit)
             
             insert_btn = QPushButton(f"📝 Вариант {i+1}")
-            # Используем замыкание для правильной передачи индекса
-            def make_insert_handler(index):
-                return lambda: self.insert_text(self.alternative_edits[index].toPlainText())
-            insert_btn.clicked.connect(make_insert_handler(i))
+            # Индекс варианта привязывается через partial, без отдельного замыкания
+            insert_btn.clicked.connect(partial(self.insert_alternative, i))
             insert_btn.setEnabled(False)
             self.insert_buttons.append(insert_btn)
             alt_layout.addWidget(insert_btn)
@@ -477,6 +969,10 @@ class PromptImproverDialog(QDialog):
         else:
             QMessageBox.warning(self, "Предупреждение", "Неожиданный формат ответа")
     
+    def insert_alternative(self, index: int, checked: bool = False):
+        """Подставить вариант промпта с указанным номером."""
+        self.insert_text(self.alternative_edits[index].toPlainText())
+    
     def insert_text(self, text: str):
         """Подставить текст в поле ввода промпта в главном окне."""
         if text and text.strip():
@@ -498,6 +994,7 @@ class ImprovePromptThread(QThread):
     
     def run(self):
         """Выполнить улучшение промпта."""
+        from prompt_improver import improve_prompt_with_alternatives
         self.success, self.result = improve_prompt_with_alternatives(
             self.prompt_text,
             self.model,
@@ -506,6 +1003,29 @@ class ImprovePromptThread(QThread):
         self.finished.emit()
 
 
+def _validate_model_data(parent: QWidget, data: Dict) -> bool:
+    """
+    Проверить данные модели из ModelDialog; при ошибке показать предупреждение.
+    Поля уже очищены от пробелов в ModelDialog.get_data().
+    """
+    # Валидация полей
+    if not data['name']:
+        QMessageBox.warning(parent, "Ошибка", "Введите название модели")
+        return False
+    if not data['api_url']:
+        QMessageBox.warning(parent, "Ошибка", "Введите URL API")
+        return False
+    if not data['api_id']:
+        QMessageBox.warning(parent, "Ошибка", "Введите идентификатор API-ключа")
+        return False
+    
+    # Проверка формата URL
+    if not data['api_url'].startswith(('http://', 'https://')):
+        QMessageBox.warning(parent, "Ошибка", "URL должен начинаться с http:// или https://")
+        return False
+    return True
+
+
 class ModelsDialog(QDialog):
     """Диалог для управления моделями."""
     
@@ -534,11 +1054,11 @@ class ModelsDialog(QDialog):
         layout.addLayout(buttons_layout)
         
         # Таблица моделей
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Название", "URL API", "API ID", "Активна"])
+        self.model = ModelsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         layout.addWidget(self.table)
         
         # Кнопка закрытия
@@ -548,40 +1068,20 @@ class ModelsDialog(QDialog):
         
         self.setLayout(layout)
         self.load_models()
+        # Ширину колонок подбираем один раз, дальше пользователь меняет её сам
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
     
     def load_models(self):
         """Загрузить модели в таблицу."""
-        models = db.get_all_models()
-        self.table.setRowCount(len(models))
-        
-        for row, model in enumerate(models):
-            self.table.setItem(row, 0, QTableWidgetItem(str(model['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(model['name']))
-            self.table.setItem(row, 2, QTableWidgetItem(model['api_url']))
-            self.table.setItem(row, 3, QTableWidgetItem(model['api_id']))
-            self.table.setItem(row, 4, QTableWidgetItem("Да" if model['is_active'] else "Нет"))
-        
-        self.table.resizeColumnsToContents()
+        self.model.set_rows(db.get_all_models())
     
     def add_model(self):
         """Добавить новую модель."""
         dialog = ModelDialog(self)
         if dialog.exec_() == QDialog.Accepted:
             data = dialog.get_data()
-            # Валидация полей
-            if not data['name'] or not data['name'].strip():
-                QMessageBox.warning(self, "Ошибка", "Введите название модели")
-                return
-            if not data['api_url'] or not data['api_url'].strip():
-                QMessageBox.warning(self, "Ошибка", "Введите URL API")
-                return
-            if not data['api_id'] or not data['api_id'].strip():
-                QMessageBox.warning(self, "Ошибка", "Введите идентификатор API-ключа")
-                return
-            
-            # Проверка формата URL
-            if not (data['api_url'].startswith('http://') or data['api_url'].startswith('https://')):
-                QMessageBox.warning(self, "Ошибка", "URL должен начинаться с http:// или https://")
+            if not _validate_model_data(self, data):
                 return
             
             try:
@@ -593,33 +1093,18 @@ class ModelsDialog(QDialog):
     
     def edit_model(self):
         """Редактировать выбранную модель."""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        model_id = self.table.currentIndex().data(Qt.UserRole)
+        if model_id is None:
             QMessageBox.warning(self, "Ошибка", "Выберите модель для редактирования")
             return
         
-        model_id = int(self.table.item(current_row, 0).text())
-        model_data = db.get_all_models()
-        model = next((m for m in model_data if m['id'] == model_id), None)
+        model = db.get_model_by_id(model_id)
         
         if model:
             dialog = ModelDialog(self, model)
             if dialog.exec_() == QDialog.Accepted:
                 data = dialog.get_data()
-                # Валидация полей
-                if not data['name'] or not data['name'].strip():
-                    QMessageBox.warning(self, "Ошибка", "Введите название модели")
-                    return
-                if not data['api_url'] or not data['api_url'].strip():
-                    QMessageBox.warning(self, "Ошибка", "Введите URL API")
-                    return
-                if not data['api_id'] or not data['api_id'].strip():
-                    QMessageBox.warning(self, "Ошибка", "Введите идентификатор API-ключа")
-                    return
-                
-                # Проверка формата URL
-                if not (data['api_url'].startswith('http://') or data['api_url'].startswith('https://')):
-                    QMessageBox.warning(self, "Ошибка", "URL должен начинаться с http:// или https://")
+                if not _validate_model_data(self, data):
                     return
                 
                 try:
@@ -631,8 +1116,8 @@ class ModelsDialog(QDialog):
     
     def delete_model(self):
         """Удалить выбранную модель."""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        model_id = self.table.currentIndex().data(Qt.UserRole)
+        if model_id is None:
             QMessageBox.warning(self, "Ошибка", "Выберите модель для удаления")
             return
         
@@ -643,24 +1128,29 @@ class ModelsDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            model_id = int(self.table.item(current_row, 0).text())
             db.delete_model(model_id)
             self.load_models()
     
     def toggle_active(self):
         """Переключить активность выбранной модели."""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        # Строка модели таблицы уже содержит is_active — повторно читать БД не нужно
+        model = self.model.row_data(self.table.currentIndex())
+        if not model:
             QMessageBox.warning(self, "Ошибка", "Выберите модель")
             return
         
-        model_id = int(self.table.item(current_row, 0).text())
-        current_status = self.table.item(current_row, 4).text()
-        new_status = 0 if current_status == "Да" else 1
-        db.toggle_model_active(model_id, new_status)
+        new_status = 0 if model['is_active'] else 1
+        db.toggle_model_active(model['id'], new_status)
         self.load_models()
 
 
+# Сколько сохранённых результатов загружать из БД за один раз при прокрутке
+RESULTS_PAGE_SIZE = 200
+
+# Ширина колонок таблицы сохранённых результатов: (колонка, пиксели)
+RESULTS_DIALOG_COLUMN_WIDTHS = ((0, 50), (1, 80), (2, 200), (4, 150))
+
+
 class ResultsDialog(QDialog):
     """Диалог для просмотра сохранённых результатов."""
     
@@ -671,65 +1161,25 @@ class ResultsDialog(QDialog):
         self.resize(1000, 700)
         
         # Проверяем текущую тему
-        current_theme = db.get_setting(THEME_SETTING_KEY) or THEME_SYSTEM
+        current_theme = get_current_theme()
         is_dark = current_theme == THEME_DARK
         
         # Применяем тёмную тему к диалогу, если выбрана тёмная тема
         if is_dark:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #353535;
-                    color: #ffffff;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QLineEdit {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 4px;
-                    border-radius: 3px;
-                }
-                QTableWidget {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    gridline-color: #555555;
-                    selection-background-color: #2a82da;
-                }
-                QHeaderView::section {
-                    background-color: #353535;
-                    color: #ffffff;
-                    padding: 4px;
-                    border: 1px solid #555555;
-                }
-                QPushButton {
-                    background-color: #353535;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 6px 20px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #2a82da;
-                    border-color: #2a82da;
-                }
-                QPushButton:pressed {
-                    background-color: #1e5fa0;
-                }
-                QPushButton:disabled {
-                    background-color: #2a2a2a;
-                    color: #888888;
-                    border-color: #444444;
-                }
-            """)
+            self.setStyleSheet(DARK_RESULTS_DIALOG_STYLESHEET)
             # Тёмная полоса заголовка для Windows
             app = QApplication.instance()
             if app:
                 _set_windows_dark_title_bar(app, dark=True)
         
-        # Хранилище полных текстов результатов
-        self.full_results: List[Dict] = []
+        # Все результаты из БД: загружаются целиком только для поиска,
+        # до этого таблица подгружает их страницами
+        self.full_results: Optional[List[Dict]] = None
+        # Строки для поиска (все поля результата в нижнем регистре), строятся при первом поиске
+        self._haystacks: Optional[List[str]] = None
+        # Последний запрос и индексы найденных строк: уточнение запроса ищет только среди них
+        self._last_query = ""
+        self._last_matches: Optional[List[int]] = None
         
         layout = QVBoxLayout()
         
@@ -738,34 +1188,40 @@ class ResultsDialog(QDialog):
         search_layout.addWidget(QLabel("Поиск:"))
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Введите текст для поиска...")
-        self.search_edit.textChanged.connect(self.search_results)
+        # Поиск запускается после паузы в наборе, а не на каждое нажатие клавиши
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.search_results)
+        self.search_edit.textChanged.connect(lambda: self.search_timer.start())
         search_layout.addWidget(self.search_edit)
         layout.addLayout(search_layout)
         
         # Таблица результатов
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["ID", "Промпт ID", "Модель", "Ответ", "Дата"])
+        self.model = ResultsTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
-        # Настраиваем колонки
-        self.table.setColumnWidth(0, 50)  # ID
-        self.table.setColumnWidth(1, 80)  # Промпт ID
-        self.table.setColumnWidth(2, 200)  # Модель
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)  # Ответ растягивается
-        self.table.setColumnWidth(4, 150)  # Дата
+        # Настраиваем колонки (до заполнения таблицы, пересчитывать ещё нечего):
+        # ID, Промпт ID, Модель, Дата — фиксированная ширина, Ответ растягивается
+        header = self.table.horizontalHeader()
+        for column, width in RESULTS_DIALOG_COLUMN_WIDTHS:
+            header.resizeSection(column, width)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
         
         # Настраиваем отображение строк - компактное, без пропусков
         self.table.setWordWrap(False)  # Отключаем перенос текста для компактности
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)  # Фиксированная высота строк
-        self.table.verticalHeader().setDefaultSectionSize(40)  # Компактная высота строк
-        self.table.verticalHeader().setVisible(False)  # Скрываем номера строк для экономии места
+        rows_header = self.table.verticalHeader()
+        rows_header.setSectionResizeMode(QHeaderView.Fixed)  # Фиксированная высота строк
+        rows_header.setDefaultSectionSize(40)  # Компактная высота строк
+        rows_header.setVisible(False)  # Скрываем номера строк для экономии места
         
         # Включаем выбор строк
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setSelectionMode(QTableView.SingleSelection)
         
         # Подключаем двойной клик для открытия
-        self.table.itemDoubleClicked.connect(self.open_selected_result)
+        self.table.doubleClicked.connect(self.open_selected_result)
         
         layout.addWidget(self.table)
         
@@ -786,61 +1242,61 @@ class ResultsDialog(QDialog):
         
         layout.addLayout(buttons_layout)
         
-        # Подключаем сигнал изменения выбора
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        # Подключаем сигнал изменения выбора; сброс модели (новая выборка поиска,
+        # перезагрузка) очищает выбор без selectionChanged, поэтому слушаем и его
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.model.modelReset.connect(self.on_selection_changed)
         
         self.setLayout(layout)
         self.load_results()
     
     def on_selection_changed(self):
         """Обработчик изменения выбора в таблице."""
-        has_selection = len(self.table.selectedItems()) > 0
-        self.open_button.setEnabled(has_selection)
+        self.open_button.setEnabled(self.table.selectionModel().hasSelection())
     
     def load_results(self):
         """Загрузить результаты в таблицу."""
-        self.full_results = db.get_all_results()
-        self.update_table(self.full_results)
+        self.full_results = None
+        self._haystacks = None
+        self._last_query = ""
+        self._last_matches = None
+        self.model.set_paged_source(db.get_results_page, db.count_results())
     
     def update_table(self, results: List[Dict]):
         """Обновить таблицу с результатами."""
-        self.table.setRowCount(len(results))
-        
-        for row, result in enumerate(results):
-            self.table.setItem(row, 0, QTableWidgetItem(str(result['id'])))
-            self.table.setItem(row, 1, QTableWidgetItem(str(result['prompt_id'])))
-            self.table.setItem(row, 2, QTableWidgetItem(result['model_name']))
-            
-            # Показываем текст ответа (обрезаем для компактности, полный текст в tooltip)
-            response_text = result['response_text'] or ""
-            # Обрезаем до 100 символов для компактного отображения
-            display_text = response_text[:100] + "..." if len(response_text) > 100 else response_text
-            response_item = QTableWidgetItem(display_text)
-            response_item.setToolTip(response_text)  # Полный текст в подсказке
-            self.table.setItem(row, 3, response_item)
-            
-            self.table.setItem(row, 4, QTableWidgetItem(result['created_at']))
-        
-        # Устанавливаем фиксированную высоту для всех строк (компактное отображение)
-        for row in range(self.table.rowCount()):
-            self.table.setRowHeight(row, 40)
+        # Высота строк задаётся вертикальным заголовком (Fixed, 40 px)
+        self.model.set_rows(results)
     
     def search_results(self):
         """Поиск результатов."""
         query = self.search_edit.text().strip().lower()
-        if query:
-            # Фильтруем результаты по запросу
-            filtered_results = [
-                r for r in self.full_results
-                if query in str(r['id']).lower() or
-                   query in str(r['prompt_id']).lower() or
-                   query in r['model_name'].lower() or
-                   query in (r['response_text'] or "").lower() or
-                   query in (r['created_at'] or "").lower()
+        if not query:
+            self._last_query = ""
+            self._last_matches = None
+            if self.full_results is not None:
+                self.update_table(self.full_results)
+            return
+        
+        if self.full_results is None:
+            self.full_results = db.get_all_results()
+        if self._haystacks is None:
+            # Поля разделены символом \x1f, чтобы совпадение не склеивало соседние поля
+            self._haystacks = [
+                f"{r['id']}\x1f{r['prompt_id']}\x1f{r['model_name']}\x1f"
+                f"{r['response_text'] or ''}\x1f{r['created_at'] or ''}".lower()
+                for r in self.full_results
             ]
-            self.update_table(filtered_results)
+        
+        # Если запрос дополняет предыдущий, подходящие строки — среди уже найденных
+        if self._last_matches is not None and query.startswith(self._last_query):
+            candidates = self._last_matches
         else:
-            self.update_table(self.full_results)
+            candidates = range(len(self.full_results))
+        haystacks = self._haystacks
+        matches = [i for i in candidates if query in haystacks[i]]
+        self._last_query = query
+        self._last_matches = matches
+        self.update_table([self.full_results[i] for i in matches])
     
     def open_selected_result(self):
         """Открыть выбранный результат в формате Markdown."""
@@ -849,29 +1305,13 @@ class ResultsDialog(QDialog):
             QMessageBox.warning(self, "Предупреждение", "Выберите результат для просмотра")
             return
         
-        row = selected_rows[0].row()
-        if row < 0 or row >= self.table.rowCount():
-            return
-        
-        # Получаем данные из таблицы напрямую
-        id_item = self.table.item(row, 0)
-        model_item = self.table.item(row, 2)
-        response_item = self.table.item(row, 3)
-        
-        if not id_item or not model_item or not response_item:
+        # Строка модели хранит полный результат из БД
+        result = self.model.row_data(selected_rows[0])
+        if not result:
             return
         
-        # Получаем полный текст ответа из базы данных по ID
-        result_id = int(id_item.text())
-        result = next((r for r in self.full_results if r['id'] == result_id), None)
-        
-        if not result:
-            # Если не нашли в полном списке, используем данные из таблицы
-            response_text = response_item.text()
-            model_name = model_item.text()
-        else:
-            response_text = result['response_text'] or ""
-            model_name = result['model_name']
+        response_text = result['response_text'] or ""
+        model_name = result['model_name']
         
         # Открываем диалог просмотра Markdown
         dialog = MarkdownViewerDialog(
@@ -882,24 +1322,57 @@ class ResultsDialog(QDialog):
         dialog.exec_()
 
 
+# Заголовки верхних уровней в готовом HTML (при их наличии первый абзац не выделяется)
+_RE_HTML_HEADING = re.compile(r'<h[1-3]>')
+# HTML начинается с абзаца (проверка без копирования строки через lstrip)
+_RE_HTML_LEADING_P = re.compile(r'\s*<p>')
+
+# Тексты длиннее этого числа символов рендерятся без кэширования
+MARKDOWN_CACHE_MAX_LEN = 200_000
+
+# Общий конвертер Markdown: создаётся при первом рендере, перед каждым текстом вызывается reset()
+_MD = None
+
+
+def _render_markdown(text: str) -> str:
+    """Отрендерить Markdown в HTML."""
+    global _MD
+    if _MD is None:
+        # Импортируем markdown только при первом открытии ответа — это ускоряет запуск
+        import markdown
+        _MD = markdown.Markdown(
+            extensions=['extra', 'nl2br', 'sane_lists'],
+            output_format='html5'
+        )
+    html_body = _MD.reset().convert(text)
+    # Если в ответе нет заголовков и списков — выделяем первую строку как заголовок
+    lead = _RE_HTML_LEADING_P.match(html_body)
+    if lead and not _RE_HTML_HEADING.search(html_body):
+        # Вставляем класс прямо в найденный тег, без повторного поиска '<p>'
+        cut = lead.end() - 1
+        html_body = html_body[:cut] + ' class="lead">' + html_body[lead.end():]
+    return html_body
+
+
+@lru_cache(maxsize=256)
+def _render_markdown_cached(text: str) -> str:
+    """Отрендерить Markdown в HTML (результат кэшируется по тексту)."""
+    return _render_markdown(text)
+
+
 def markdown_to_html(text: str) -> str:
     """Конвертировать Markdown в HTML с расширенной поддержкой форматирования."""
     if not text or not text.strip():
         return "<p class='empty'><em>(Пусто)</em></p>"
-    html_body = markdown.markdown(
-        text,
-        extensions=['extra', 'nl2br', 'sane_lists'],
-        output_format='html5'
-    )
-    # Если в ответе нет заголовков и списков — выделяем первую строку как заголовок
-    if '<h1>' not in html_body and '<h2>' not in html_body and '<h3>' not in html_body:
-        if html_body.strip().startswith('<p>'):
-            first_p_end = html_body.find('</p>') + 4
-            first_p = html_body[:first_p_end]
-            rest = html_body[first_p_end:]
-            first_p = first_p.replace('<p>', '<p class="lead">', 1)
-            html_body = first_p + rest
-    return html_body
+    # Очень длинные ответы в кэш не кладём, чтобы он не удерживал мегабайты HTML
+    if len(text) > MARKDOWN_CACHE_MAX_LEN:
+        return _render_markdown(text)
+    return _render_markdown_cached(text)
+
+
+def clear_markdown_html_cache() -> None:
+    """Сбросить кэш HTML, отрендеренного markdown_to_html."""
+    _render_markdown_cached.cache_clear()
 
 
 # Профессиональные стили для отображения Markdown
@@ -1239,6 +1712,12 @@ tr:hover {
 }
 """
 
+# Готовые стили просмотрщика для каждой темы: (CSS документа, стиль QTextBrowser)
+MARKDOWN_VIEWER_STYLES = {
+    False: (MARKDOWN_VIEWER_CSS, "QTextBrowser { background-color: #fafafa; }"),
+    True: (MARKDOWN_VIEWER_CSS_DARK, "QTextBrowser { background-color: #2a2a2a; }"),
+}
+
 
 class MarkdownViewerDialog(QDialog):
     """Диалог для отображения ответа в форматированном Markdown."""
@@ -1250,31 +1729,12 @@ class MarkdownViewerDialog(QDialog):
         self.resize(800, 600)
         
         # Проверяем текущую тему
-        current_theme = db.get_setting(THEME_SETTING_KEY) or THEME_SYSTEM
+        current_theme = get_current_theme()
         is_dark = current_theme == THEME_DARK
         
         # Применяем тёмную тему к диалогу, если выбрана тёмная тема
         if is_dark:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #353535;
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #353535;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 6px 20px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #2a82da;
-                    border-color: #2a82da;
-                }
-                QPushButton:pressed {
-                    background-color: #1e5fa0;
-                }
-            """)
+            self.setStyleSheet(DARK_DIALOG_STYLESHEET)
             # Тёмная полоса заголовка для Windows
             app = QApplication.instance()
             if app:
@@ -1285,18 +1745,12 @@ class MarkdownViewerDialog(QDialog):
         self.browser.setOpenExternalLinks(True)
         
         # Выбираем CSS в зависимости от темы
-        if is_dark:
-            browser_bg = "#2a2a2a"
-            css = MARKDOWN_VIEWER_CSS_DARK
-        else:
-            browser_bg = "#fafafa"
-            css = MARKDOWN_VIEWER_CSS
+        css, browser_style = MARKDOWN_VIEWER_STYLES[is_dark]
+        self.browser.setStyleSheet(browser_style)
         
-        self.browser.setStyleSheet(f"QTextBrowser {{ background-color: {browser_bg}; }}")
-        
-        html_content = markdown_to_html(content if content else "")
-        full_html = f"<!DOCTYPE html><html><head><meta charset='utf-8'><style>{css}</style></head><body>{html_content}</body></html>"
-        self.browser.setHtml(full_html)
+        # CSS задаётся документу как стиль по умолчанию, в setHtml передаётся только тело ответа
+        self.browser.document().setDefaultStyleSheet(css)
+        self.browser.setHtml(f"<body>{markdown_to_html(content if content else '')}</body>")
         
         layout.addWidget(self.browser)
         
@@ -1317,56 +1771,12 @@ class SettingsDialog(QDialog):
         self.resize(550, 450)
         
         # Проверяем текущую тему
-        current_theme = db.get_setting(THEME_SETTING_KEY) or THEME_SYSTEM
+        current_theme = get_current_theme()
         is_dark = current_theme == THEME_DARK
         
         # Применяем тёмную тему к диалогу, если выбрана тёмная тема
         if is_dark:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #353535;
-                    color: #ffffff;
-                }
-                QGroupBox {
-                    font-weight: bold;
-                    border: 2px solid #555555;
-                    border-radius: 5px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px;
-                }
-                QRadioButton {
-                    color: #ffffff;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QSpinBox {
-                    background-color: #2a2a2a;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 4px;
-                    border-radius: 3px;
-                }
-                QPushButton {
-                    background-color: #353535;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 6px 20px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #2a82da;
-                    border-color: #2a82da;
-                }
-                QPushButton:pressed {
-                    background-color: #1e5fa0;
-                }
-            """)
+            self.setStyleSheet(DARK_SETTINGS_DIALOG_STYLESHEET)
             # Тёмная полоса заголовка для Windows
             app = QApplication.instance()
             if app:
@@ -1460,34 +1870,12 @@ class AboutDialog(QDialog):
         self.resize(550, 450)
         
         # Проверяем текущую тему
-        current_theme = db.get_setting(THEME_SETTING_KEY) or THEME_SYSTEM
+        current_theme = get_current_theme()
         is_dark = current_theme == THEME_DARK
         
         # Применяем тёмную тему к диалогу, если выбрана тёмная тема
         if is_dark:
-            self.setStyleSheet("""
-                QDialog {
-                    background-color: #353535;
-                    color: #ffffff;
-                }
-                QLabel {
-                    color: #ffffff;
-                }
-                QPushButton {
-                    background-color: #353535;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 6px 20px;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #2a82da;
-                    border-color: #2a82da;
-                }
-                QPushButton:pressed {
-                    background-color: #1e5fa0;
-                }
-            """)
+            self.setStyleSheet(DARK_ABOUT_DIALOG_STYLESHEET)
             # Тёмная полоса заголовка для Windows
             app = QApplication.instance()
             if app:
@@ -1567,33 +1955,65 @@ class MovingSegmentBar(QWidget):
         super().__init__(parent)
         self.setFixedHeight(10)
         self._value = 0.0  # 0–100, позиция отрезка (float для плавности)
+        self._background: Optional[QPixmap] = None  # фон (трек), рисуется заново при смене размера или масштаба экрана
+        # Градиент бегунка: цвета задаются один раз, в кадре меняются только координаты
+        self._grad = QLinearGradient(0, 0, self.SEGMENT_WIDTH, 0)
+        self._grad.setColorAt(0, QColor(154, 205, 50))      # насыщенный янтарно-зелёный #9acd32
+        self._grad.setColorAt(1, QColor(184, 212, 168, 0))  # тот же тон, полностью прозрачный
+
+    def _segment_x(self, value: float) -> float:
+        """Позиция бегунка в пикселях (с дробной частью для плавного движения)."""
+        return (value / 100.0) * (self.width() - self.SEGMENT_WIDTH)
 
     def setValue(self, value: float):
-        self._value = max(0.0, min(100.0, float(value)))
-        self.update()
+        value = max(0.0, min(100.0, float(value)))
+        if value == self._value:
+            return
+        # Перерисовываем только полосу, которую занимал и займёт бегунок
+        old_x = self._segment_x(self._value)
+        new_x = self._segment_x(value)
+        self._value = value
+        left = int(min(old_x, new_x)) - 1
+        right = int(max(old_x, new_x)) + self.SEGMENT_WIDTH + 2
+        self.update(QRect(left, 0, right - left, self.height()))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._background = None
+
+    def _render_background(self, w: int, h: int, ratio: float) -> QPixmap:
+        """Нарисовать фон (трек) в пиксмап с учётом масштаба экрана."""
+        pixmap = QPixmap(int(w * ratio), int(h * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        qp = QPainter(pixmap)
+        qp.setRenderHint(QPainter.Antialiasing)
+        qp.setPen(Qt.NoPen)
+        qp.setBrush(QColor("#2a2a2a"))
+        qp.drawRoundedRect(0, 0, w, h, 5, 5)
+        qp.end()
+        return pixmap
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        qp = QPainter(self)
-        qp.setRenderHint(QPainter.Antialiasing)
-        qp.setRenderHint(QPainter.SmoothPixmapTransform)
         w, h = self.width(), self.height()
         if w < self.SEGMENT_WIDTH or h <= 0:
             return
+        # Окно могли перенести на экран с другим масштабом — тогда фон рисуется заново
+        ratio = self.devicePixelRatioF()
+        if self._background is None or self._background.devicePixelRatioF() != ratio:
+            self._background = self._render_background(w, h, ratio)
+        qp = QPainter(self)
+        qp.setRenderHint(QPainter.Antialiasing)
+        qp.setRenderHint(QPainter.SmoothPixmapTransform)
         # Фон (трек)
+        qp.drawPixmap(0, 0, self._background)
         qp.setPen(Qt.NoPen)
-        qp.setBrush(QColor("#2a2a2a"))
-        qp.drawRoundedRect(0, 0, w, h, 5, 5)
         # Бегунок: позиция в пикселях с дробной частью для плавного движения
-        x = (self._value / 100.0) * (w - self.SEGMENT_WIDTH)
-        grad = QLinearGradient(x, 0, x + self.SEGMENT_WIDTH, 0)
-        head = QColor(154, 205, 50)   # насыщенный янтарно-зелёный #9acd32
-        head.setAlpha(255)
-        tail = QColor(184, 212, 168)  # тот же тон
-        tail.setAlpha(0)
-        grad.setColorAt(0, head)
-        grad.setColorAt(1, tail)
-        qp.setBrush(QBrush(grad))
+        x = self._segment_x(self._value)
+        self._grad.setStart(x, 0)
+        self._grad.setFinalStop(x + self.SEGMENT_WIDTH, 0)
+        qp.setBrush(QBrush(self._grad))
         qp.drawRoundedRect(QRectF(x, 0, self.SEGMENT_WIDTH, h), 5, 5)
         qp.end()
 
@@ -1611,6 +2031,13 @@ class MainWindow(QMainWindow):
         self.current_prompt_id: Optional[int] = None
         self.current_prompt_text: str = ""
         
+        # Строка заголовка настраивается только при первом показе окна;
+        # дальше её обновляет apply_theme при смене темы
+        self._title_bar_applied = False
+        
+        # Пункты комбобокса активных моделей (ID, название) с последней загрузки
+        self._combo_items: Optional[List[Tuple[int, str]]] = None
+        
         # Инициализация БД
         db.init_database()
         
@@ -1627,7 +2054,10 @@ class MainWindow(QMainWindow):
     def showEvent(self, event):
         """При первом показе окна применяем тёмную полосу заголовка на Windows, если тема тёмная."""
         super().showEvent(event)
-        current_theme = db.get_setting(THEME_SETTING_KEY) or THEME_SYSTEM
+        if self._title_bar_applied:
+            return
+        self._title_bar_applied = True
+        current_theme = get_current_theme()
         if current_theme == THEME_DARK:
             app = QApplication.instance()
             if app:
@@ -1706,6 +2136,9 @@ class MainWindow(QMainWindow):
         self.request_progress_timer = QTimer(self)
         self.request_progress_timer.timeout.connect(self._animate_request_progress)
         self._request_progress_value = 0
+        # Число полученных ответов: сигнал потока только меняет счётчик,
+        # а полоса прогресса перерисовывается по тику таймера анимации
+        self._completed_requests = 0
         
         # Верхний блок (промпт) — доля 1 при растяжении
         main_layout.addWidget(prompt_group, 1)
@@ -1714,23 +2147,26 @@ class MainWindow(QMainWindow):
         results_label = QLabel("Результаты:")
         main_layout.addWidget(results_label)
 
-        self.results_table = QTableWidget()
+        self.results_model = TempResultsTableModel(self)
+        self.results_model.set_rows(self.temp_results)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_model)
         self.results_table.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        self.results_table.setColumnCount(3)
-        self.results_table.setHorizontalHeaderLabels(["Модель", "Ответ", "Выбрано"])
         self.results_table.setWordWrap(True)
-        # Включаем автоматическое изменение высоты строк
-        self.results_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        rows_header = self.results_table.verticalHeader()
+        # Высота строк одинаковая и не пересчитывается по содержимому (полный ответ — кнопка «Открыть»)
+        rows_header.setSectionResizeMode(QHeaderView.Fixed)
         # Настраиваем растяжение колонок
-        self.results_table.horizontalHeader().setStretchLastSection(False)  # Отключаем растяжение последней секции
-        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)  # Колонка "Ответ" растягивается
-        self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Fixed)  # Колонка "Выбрано" фиксированной ширины
-        self.results_table.setColumnWidth(2, 30)  # Устанавливаем ширину 30 пикселей для колонки "Выбрано"
+        header = self.results_table.horizontalHeader()
+        header.setStretchLastSection(False)  # Отключаем растяжение последней секции
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)  # Колонка "Ответ" растягивается
+        header.setSectionResizeMode(2, QHeaderView.Fixed)  # Колонка "Выбрано" фиксированной ширины
+        header.resizeSection(2, 30)  # Устанавливаем ширину 30 пикселей для колонки "Выбрано"
         # Устанавливаем ширину вертикального заголовка (номера строк) в 20 пикселей
-        self.results_table.verticalHeader().setFixedWidth(20)  # Ширина столбца с номерами строк
-        # Минимальная высота строки для колонки "Ответ" (примерно 4–5 строк текста)
-        self.results_table.verticalHeader().setDefaultSectionSize(100)
+        rows_header.setFixedWidth(20)  # Ширина столбца с номерами строк
+        # Высота строки для колонки "Ответ" (примерно 4–5 строк текста)
+        rows_header.setDefaultSectionSize(100)
         # Таблица результатов — доля 2, забирает оставшееся пространство по высоте
         main_layout.addWidget(self.results_table, 2)
         
@@ -1794,14 +2230,15 @@ class MainWindow(QMainWindow):
         results_menu.addAction(view_results_action)
         
         # Подменю экспорта
-        export_menu = results_menu.addMenu("Экспорт")
+        # Подменю недоступно, пока идёт экспорт (см. start_export)
+        self.export_menu = results_menu.addMenu("Экспорт")
         export_markdown_action = QAction("Экспорт в Markdown", self)
         export_markdown_action.triggered.connect(self.export_to_markdown)
-        export_menu.addAction(export_markdown_action)
+        self.export_menu.addAction(export_markdown_action)
         
         export_json_action = QAction("Экспорт в JSON", self)
         export_json_action.triggered.connect(self.export_to_json)
-        export_menu.addAction(export_json_action)
+        self.export_menu.addAction(export_json_action)
         
         # Меню "Настройки"
         settings_menu = menubar.addMenu("Настройки")
@@ -1832,10 +2269,18 @@ class MainWindow(QMainWindow):
         """Загрузить список активных моделей в комбобокс."""
         # Загружаем только активные модели (is_active=1)
         active_models = get_active_models_list()
+        combo_items = [(model.id, model.name) for model in active_models]
+        # Список не изменился — комбобокс не перестраиваем
+        if combo_items == self._combo_items:
+            return
+        self._combo_items = combo_items
+        # При перестройке не рассылаем currentIndexChanged на каждый добавленный пункт
+        self.prompt_combo.blockSignals(True)
         self.prompt_combo.clear()
         self.prompt_combo.addItem("Активные модели", None)
-        for model in active_models:
-            self.prompt_combo.addItem(model.name, model.id)
+        for model_id, name in combo_items:
+            self.prompt_combo.addItem(name, model_id)
+        self.prompt_combo.blockSignals(False)
     
     def on_prompt_selected(self, index):
         """Обработчик выбора модели из комбобокса."""
@@ -1893,10 +2338,20 @@ class MainWindow(QMainWindow):
     
     def _animate_request_progress(self):
         """Плавная анимация полосы ожидания (~50 FPS, малый шаг)."""
+        if self.request_progress_bar.isHidden():
+            # Полосу скрыли, а таймер остался запущенным — не тратим тики впустую
+            self.request_progress_timer.stop()
+            return
         self._request_progress_value += 0.4  # полный цикл ~5 с при интервале 20 мс
         if self._request_progress_value >= 100:
             self._request_progress_value = 0.0
         self.request_progress_bar.setValue(self._request_progress_value)
+        if self.progress_bar.value() != self._completed_requests:
+            self.progress_bar.setValue(self._completed_requests)
+    
+    def on_request_progress(self, completed: int):
+        """Запомнить число полученных ответов (отрисуется на следующем тике таймера)."""
+        self._completed_requests = completed
     
     def send_requests(self):
         """Отправить запросы ко всем активным моделям."""
@@ -1931,6 +2386,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setMaximum(len(active_models))
         self.progress_bar.setValue(0)
+        self._completed_requests = 0
         self.send_button.setEnabled(False)
         self.statusBar.showMessage(f"Отправка запросов к {len(active_models)} моделям...")
         
@@ -1942,6 +2398,7 @@ class MainWindow(QMainWindow):
         
         # Создаём поток для выполнения запросов (с дополненным промптом)
         self.request_thread = RequestThread(active_models, enhanced_prompt)
+        self.request_thread.progress.connect(self.on_request_progress)
         self.request_thread.finished.connect(self.on_requests_finished)
         self.request_thread.start()
     
@@ -1952,10 +2409,9 @@ class MainWindow(QMainWindow):
         self.request_progress_bar.setVisible(False)
         self.send_button.setEnabled(True)
         
-        # Обновляем таблицу результатов
-        self.results_table.setRowCount(len(results))
-        
-        for row, result in enumerate(results):
+        # Заполняем временную таблицу; строки добавляются в модель одной вставкой
+        new_rows = []
+        for result in results:
             model = result['model']
             success = result['success']
             response = result['response']
@@ -1964,40 +2420,20 @@ class MainWindow(QMainWindow):
             log_request(self.logger, model.name, self.current_prompt_text, success, 
                       response if success else "", response if not success else "")
             
-            # Название модели
-            model_item = QTableWidgetItem(model.name)
-            if not success:
-                model_item.setForeground(Qt.red)
-            self.results_table.setItem(row, 0, model_item)
-            
-            # Ответ - убираем Markdown-разметку для отображения в таблице
             response_text = response if success else f"Ошибка: {response}"
-            # В таблице показываем обычный текст без форматирования
-            plain_text = strip_markdown(response_text) if success else response_text
-            response_item = QTableWidgetItem(plain_text)
-            response_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
-            # Включаем перенос текста для ячейки
-            response_item.setFlags(response_item.flags() | Qt.TextWordWrap)
-            self.results_table.setItem(row, 1, response_item)
-            # Высота строки не менее 100 px (несколько строк текста)
-            self.results_table.setRowHeight(row, max(100, self.results_table.rowHeight(row)))
-            
-            # Чекбокс
-            checkbox = QCheckBox()
-            checkbox.setChecked(success)  # По умолчанию выбираем успешные ответы
-            checkbox.setEnabled(success)  # Отключаем для ошибок
-            self.results_table.setCellWidget(row, 2, checkbox)
+            # В таблице показываем обычный текст без Markdown (подготовлен в RequestThread)
+            plain_text = result['plain_text']
             
             # Сохраняем во временную таблицу (сохраняем оригинальный текст с Markdown для диалога "Открыть")
-            self.temp_results.append({
+            new_rows.append({
                 'model_name': model.name,
                 'response_text': response_text,  # Оригинальный текст с Markdown
                 'plain_text': plain_text,  # Текст без Markdown для таблицы
-                'selected': success,
+                'selected': success,  # По умолчанию выбираем успешные ответы
                 'success': success
             })
+        self.results_model.append_rows(new_rows)
         
-        self.results_table.resizeColumnsToContents()
         self.save_button.setEnabled(True)
         self.open_button.setEnabled(True)
         success_count = len([r for r in results if r['success']])
@@ -2010,24 +2446,20 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Ошибка", "Нет активного промпта")
             return
         
-        saved_count = 0
-        for row in range(self.results_table.rowCount()):
-            checkbox = self.results_table.cellWidget(row, 2)
-            if checkbox and checkbox.isChecked():
-                model_name = self.results_table.item(row, 0).text()
+        rows_to_save = []
+        for result in self.temp_results:
+            if result['selected']:
                 # Берём оригинальный текст с Markdown из временной таблицы
-                if row < len(self.temp_results) and self.temp_results[row].get('response_text'):
-                    response_text = self.temp_results[row]['response_text']
-                else:
-                    # Если нет в временной таблице, берём из ячейки
-                    response_text = self.results_table.item(row, 1).text()
+                response_text = result['response_text']
                 
                 # Пропускаем ошибки
                 if response_text.startswith("Ошибка:"):
                     continue
                 
-                db.save_result(self.current_prompt_id, model_name, response_text)
-                saved_count += 1
+                rows_to_save.append((self.current_prompt_id, result['model_name'], response_text))
+        
+        # Все выбранные ответы записываются одной транзакцией
+        saved_count = db.save_results_bulk(rows_to_save)
         
         if saved_count > 0:
             log_action(self.logger, "Сохранение результатов", f"Сохранено: {saved_count}")
@@ -2038,27 +2470,26 @@ class MainWindow(QMainWindow):
     
     def clear_results(self):
         """Очистить таблицу результатов."""
-        self.results_table.setRowCount(0)
-        self.temp_results.clear()
+        # Новый список вместо clear(): старые ответы освобождаются целиком,
+        # модель таблицы переключается на него одним сбросом
+        self.temp_results = []
+        self.results_model.set_rows(self.temp_results)
         self.save_button.setEnabled(False)
         self.open_button.setEnabled(False)
     
     def open_response_markdown(self):
         """Открыть выбранный ответ в окне с форматированным Markdown."""
-        row = self.results_table.currentRow()
-        if row < 0 and self.results_table.rowCount() > 0:
+        row = self.results_table.currentIndex().row()
+        if row < 0 and self.temp_results:
             row = 0
         if row < 0:
             QMessageBox.warning(self, "Ошибка", "Нет результатов. Сначала отправьте запрос.")
             return
         
-        model_name = self.results_table.item(row, 0).text()
         # Получаем оригинальный текст с Markdown из временной таблицы
-        if row < len(self.temp_results) and self.temp_results[row].get('response_text'):
-            response_text = self.temp_results[row]['response_text']
-        else:
-            # Если нет в временной таблице, берём из ячейки (но там уже без Markdown)
-            response_text = self.results_table.item(row, 1).text()
+        result = self.temp_results[row]
+        model_name = result['model_name']
+        response_text = result['response_text']
         title = f"Ответ: {model_name}"
         dialog = MarkdownViewerDialog(self, title=title, content=response_text)
         dialog.exec_()
@@ -2135,12 +2566,8 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            success = export_to_markdown(self.temp_results, self.current_prompt_text, file_path)
-            if success:
-                log_action(self.logger, "Экспорт в Markdown", f"Файл: {file_path}")
-                QMessageBox.information(self, "Успех", f"Результаты экспортированы в {file_path}")
-            else:
-                QMessageBox.warning(self, "Ошибка", "Не удалось экспортировать результаты")
+            from export import export_to_markdown
+            self.start_export(export_to_markdown, file_path, "Экспорт в Markdown")
     
     def export_to_json(self):
         """Экспортировать текущие результаты в JSON."""
@@ -2156,12 +2583,33 @@ class MainWindow(QMainWindow):
         )
         
         if file_path:
-            success = export_to_json(self.temp_results, self.current_prompt_text, file_path)
-            if success:
-                log_action(self.logger, "Экспорт в JSON", f"Файл: {file_path}")
-                QMessageBox.information(self, "Успех", f"Результаты экспортированы в {file_path}")
-            else:
-                QMessageBox.warning(self, "Ошибка", "Не удалось экспортировать результаты")
+            from export import export_to_json
+            self.start_export(export_to_json, file_path, "Экспорт в JSON")
+    
+    def start_export(self, exporter, file_path: str, action: str):
+        """Запустить экспорт результатов в фоновом потоке."""
+        # Поток получает копию списка: таблица может измениться до окончания записи
+        self.export_thread = ExportThread(exporter, list(self.temp_results), self.current_prompt_text, file_path)
+        self.export_thread.finished.connect(
+            lambda success, path: self.on_export_finished(success, path, action)
+        )
+        # Новый экспорт до окончания текущего заменил бы ссылку на работающий поток,
+        # и Python удалил бы его прямо во время записи
+        self.export_menu.setEnabled(False)
+        self.statusBar.showMessage(f"{action}...")
+        self.export_thread.start()
+    
+    def on_export_finished(self, success: bool, file_path: str, action: str):
+        """Обработчик завершения экспорта."""
+        # Сигнал отправляется в конце run(); дожидаемся выхода из потока
+        self.export_thread.wait()
+        self.export_menu.setEnabled(True)
+        self.statusBar.showMessage("Готово")
+        if success:
+            log_action(self.logger, action, f"Файл: {file_path}")
+            QMessageBox.information(self, "Успех", f"Результаты экспортированы в {file_path}")
+        else:
+            QMessageBox.warning(self, "Ошибка", "Не удалось экспортировать результаты")
 
 
 def main():